@@ -1,51 +1,859 @@
 """Pytest fixtures for k8s-watcher integration tests."""
 
+import contextlib
+import copy
+import fcntl
+import functools
+import hashlib
+import logging
 import os
+import ssl
 import subprocess
 import time
+import urllib.request
+import uuid
 import pytest
-from typing import Generator
+import yaml
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Generator, Iterator, List, Optional, Tuple
 from kubernetes import client, config
 from pytest_httpserver import HTTPServer
+from helpers import get_pod_logs, wait_cert_ready, wait_for_node_ready, wait_for_pod_ready
 
 
-@pytest.fixture(scope="session")
-def kind_cluster() -> Generator[str, None, None]:
+log = logging.getLogger(__name__)
+
+# KinD cluster shared by every test (and every pytest-xdist worker)
+CLUSTER_NAME = "k8s-watcher-test"
+
+# pytest-xdist worker id ("gw0", ...), or None when running without xdist
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+# Set KEEP_KIND_CLUSTER=1 to leave the cluster running after the session
+KEEP_KIND_CLUSTER = os.environ.get("KEEP_KIND_CLUSTER") == "1"
+
+# Records "<cluster name> <kube-system namespace UID>" of the last cluster
+# this suite created or verified, so later sessions can skip `kind get clusters`
+CLUSTER_SENTINEL = "/tmp/k8s-watcher-test.ready"
+
+# Local BuildKit layer cache shared across sessions
+BUILD_CACHE_DIR = "/tmp/k8s-watcher-buildcache"
+
+# Build inputs hashed into the image's src-hash label (paths relative to the
+# project root; directories are walked recursively)
+BUILD_INPUTS = ("Dockerfile", "Makefile", "go.mod", "go.sum", "cmd", "pkg")
+
+# Mockolate mock HTTP server used as the webhook target
+MOCK_SERVER_IMAGE = "nihalwasim/mock-http-server:latest"
+
+# cert-manager release installed for the TLS webhook tests; the manifest is
+# downloaded once and cached under CERT_MANAGER_CACHE_DIR
+CERT_MANAGER_VERSION = "v1.14.0"
+CERT_MANAGER_URL = (
+    "https://github.com/cert-manager/cert-manager/releases/download/"
+    f"{CERT_MANAGER_VERSION}/cert-manager.yaml"
+)
+CERT_MANAGER_CACHE_DIR = os.path.expanduser("~/.cache/k8s-watcher-tests")
+
+# Serializes cluster creation and image build/load across xdist workers
+SESSION_LOCK = os.path.join(CERT_MANAGER_CACHE_DIR, "session.lock")
+
+# Issuer used to check that the cert-manager webhook admits requests
+_CERT_MANAGER_PROBE_ISSUER = MappingProxyType({
+    "apiVersion": "cert-manager.io/v1",
+    "kind": "Issuer",
+    "metadata": {
+        "name": "webhook-probe",
+        "namespace": "cert-manager"
+    },
+    "spec": {
+        "selfSigned": {}
+    }
+})
+
+# Namespace holding the session's cert-manager-issued Mockolate certificate
+TLS_CERT_NAMESPACE = "k8s-watcher-it-certs"
+
+# ClusterRole granting the watcher read access, bound per namespace by _deploy_watcher
+WATCHER_CLUSTER_ROLE = "k8s-watcher-it"
+
+# Settings common to every watcher configuration used by the fixtures
+_WATCHER_CONFIG_TEMPLATE = MappingProxyType({
+    "output": {
+        "folder": "/tmp/k8s-watcher-data",
+        "folderAnnotation": "k8s-watcher-target-dir",
+        "uniqueFilenames": False,
+        "defaultFileMode": "0644"
+    },
+    "resources": {
+        "type": "both",
+        "method": "WATCH",
+        # Long enough that no test outlives its first watch, so the watcher
+        # never drops and re-lists mid-test. A dead watch would go unnoticed
+        # for longer, which does not matter on a single-node KinD cluster.
+        "watchConfig": {
+            "serverTimeout": 600,
+            "clientTimeout": 660,
+            "errorThrottleTime": 5,
+            "ignoreProcessed": True
+        }
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "LOGFMT"
+    }
+})
+
+# libyaml C dumper if available, otherwise the pure-Python safe dumper
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Field manager recorded for objects the fixtures server-side apply
+FIELD_MANAGER = "k8s-watcher-tests"
+
+# Connections kept per host by the shared ApiClient; sized above the setup
+# and cleanup pools combined so concurrent calls, watches and execs never
+# queue for a connection
+API_POOL_MAXSIZE = 32
+
+# Worker threads for concurrent fixture setup calls, reused across fixtures
+_SETUP_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="k8s-setup")
+
+# Fire-and-forget namespace deletions, drained before the session ends
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="k8s-cleanup")
+_CLEANUP_FUTURES: List[Future] = []
+
+
+def _kind_api_client(cluster_name: str) -> client.ApiClient:
     """
-    Create a KinD cluster for testing.
+    Create an ApiClient for a KinD cluster without touching global config.
     
-    Yields:
-        Cluster name
+    Args:
+        cluster_name: KinD cluster name
+        
+    Returns:
+        ApiClient for the cluster's kubeconfig context; the caller closes it
     """
-    cluster_name = "k8s-watcher-test"
-    config_path = os.path.join(os.path.dirname(__file__), "kind-config.yaml")
+    return config.new_client_from_config(
+        context=f"kind-{cluster_name}",
+        persist_config=False
+    )
+
+
+def _cluster_uid(v1: client.CoreV1Api) -> str:
+    """
+    Get the UID of the kube-system namespace of a KinD cluster.
+    
+    The UID changes whenever the cluster is recreated, so it identifies
+    a specific cluster instance rather than just its name.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client for the cluster
+        
+    Returns:
+        kube-system namespace UID
+    """
+    namespace = v1.read_namespace(
+        name="kube-system",
+        _request_timeout=2
+    )
+    return namespace.metadata.uid
+
+
+def _sentinel_cluster_alive(cluster_name: str) -> bool:
+    """
+    Check whether the cluster recorded in the sentinel file is still running.
+    
+    Args:
+        cluster_name: KinD cluster name
+        
+    Returns:
+        True if the sentinel matches a reachable cluster, False otherwise
+    """
+    try:
+        with open(CLUSTER_SENTINEL, "r") as f:
+            recorded_name, recorded_uid = f.read().split()
+    except (OSError, ValueError):
+        return False
+    
+    if recorded_name != cluster_name:
+        return False
     
-    # Check if cluster already exists
+    try:
+        api_client = _kind_api_client(cluster_name)
+    except Exception:
+        return False
+    try:
+        return _cluster_uid(client.CoreV1Api(api_client)) == recorded_uid
+    except Exception:
+        return False
+    finally:
+        api_client.close()
+
+
+def _buildx_supports_cache_export() -> bool:
+    """
+    Check whether the active buildx builder can export a local layer cache.
+    
+    The default "docker" driver rejects --cache-to, so the cache flags are
+    only used with a docker-container (or similar) builder.
+    
+    Returns:
+        True if the builder supports cache export, False otherwise
+    """
     result = subprocess.run(
-        ["kind", "get", "clusters"],
+        ["docker", "buildx", "inspect"],
         capture_output=True,
         text=True
     )
+    if result.returncode != 0:
+        return False
+    
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() == "Driver":
+            return value.strip() != "docker"
+    return False
+
+
+def _source_hash(project_root: str) -> str:
+    """
+    Hash the files the watcher image is built from.
     
-    cluster_exists = cluster_name in result.stdout
+    Args:
+        project_root: Repository root directory
+        
+    Returns:
+        Hex BLAKE2b digest over the paths and contents of BUILD_INPUTS
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in BUILD_INPUTS:
+        path = os.path.join(project_root, entry)
+        if os.path.isdir(path):
+            files = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                files.extend(os.path.join(dirpath, name) for name in sorted(filenames))
+        elif os.path.isfile(path):
+            files = [path]
+        else:
+            continue
+        
+        for file_path in files:
+            digest.update(os.path.relpath(file_path, project_root).encode())
+            with open(file_path, "rb") as f:
+                digest.update(f.read())
     
-    if not cluster_exists:
-        print(f"\nCreating KinD cluster: {cluster_name}")
-        subprocess.run(
-            ["kind", "create", "cluster", "--config", config_path, "--name", cluster_name],
-            check=True
+    return digest.hexdigest()
+
+
+def _image_source_hash(image: str) -> str:
+    """
+    Read the src-hash label of a local Docker image.
+    
+    Args:
+        image: Image name and tag
+        
+    Returns:
+        Label value, or an empty string if the image or label is missing
+    """
+    result = subprocess.run(
+        ["docker", "image", "inspect", "--format",
+         '{{index .Config.Labels "src-hash"}}', image],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return ""
+    
+    return result.stdout.strip()
+
+
+def _node_has_image(cluster_name: str, image: str) -> bool:
+    """
+    Check whether the KinD node already holds the local build of an image.
+    
+    Args:
+        cluster_name: KinD cluster name
+        image: Image name and tag
+        
+    Returns:
+        True if the node's containerd store has the same image ID
+    """
+    local = subprocess.run(
+        ["docker", "image", "inspect", "--format", "{{.Id}}", image],
+        capture_output=True,
+        text=True
+    )
+    if local.returncode != 0:
+        return False
+    
+    node = subprocess.run(
+        ["docker", "exec", f"{cluster_name}-control-plane",
+         "crictl", "images", "--no-trunc", "--quiet"],
+        capture_output=True,
+        text=True
+    )
+    if node.returncode != 0:
+        return False
+    
+    return local.stdout.strip() in node.stdout.split()
+
+
+def _retry_namespace_race(create: Callable[[], Any], attempts: int = 5) -> Any:
+    """
+    Issue a create call, retrying while its namespace is not yet visible.
+    
+    test_namespace returns as soon as the namespace is created, so the first
+    child create can occasionally reach an API server that does not see it
+    yet. Backoff starts at 50ms, which resolves the race in one retry.
+    
+    Args:
+        create: Zero-argument callable issuing one API call
+        attempts: Maximum number of attempts
+        
+    Returns:
+        Result of the call
+    """
+    for attempt in range(attempts):
+        try:
+            return create()
+        except client.exceptions.ApiException as e:
+            if (
+                e.status != 404
+                or "namespace" not in str(e.body)
+                or attempt == attempts - 1
+            ):
+                raise
+            time.sleep(0.05 * (2 ** attempt))
+
+
+def _apply(patch: Callable[..., Any], body: Any, **kwargs: Any) -> None:
+    """
+    Server-side apply an object through the matching patch_* API method.
+    
+    Unlike create, applying an object that already exists (e.g. left over
+    from a session that kept the cluster) updates it instead of failing, so
+    no delete-and-recreate cycle is needed.
+    
+    No caller uses the applied object, so the response body is read raw and
+    discarded instead of being JSON-decoded into client models.
+    
+    Args:
+        patch: API method, e.g. CoreV1Api.patch_namespaced_config_map
+        body: Full object with apiVersion and kind, as a model or dict
+        kwargs: Remaining method arguments (namespace, group, plural, ...)
+    """
+    metadata = body["metadata"] if isinstance(body, dict) else body.metadata
+    name = metadata["name"] if isinstance(metadata, dict) else metadata.name
+    resp = patch(
+        name=name,
+        body=body,
+        field_manager=FIELD_MANAGER,
+        force=True,
+        _content_type="application/apply-patch+yaml",
+        _preload_content=False,
+        **kwargs
+    )
+    # Reading the body to the end returns the connection to the pool
+    resp.read()
+
+
+def _create_concurrently(*creates: Callable[[], Any]) -> List[Any]:
+    """
+    Run independent API create calls in parallel.
+    
+    The calls share the client's urllib3 connection pool, so wall-clock time
+    is the slowest round-trip rather than the sum of all of them. Worker
+    threads come from a pool that lives for the whole session instead of
+    being spawned per fixture.
+    
+    Each call is retried through _retry_namespace_race.
+    
+    Args:
+        creates: Zero-argument callables issuing one API call each
+        
+    Returns:
+        Results of the calls, in the order given
+    """
+    futures = [_SETUP_POOL.submit(_retry_namespace_race, create) for create in creates]
+    return [future.result() for future in futures]
+
+
+def _readiness_probe(**handler: Any) -> client.V1Probe:
+    """
+    Build a readiness probe that checks every second from container start.
+    
+    The defaults (10s period) leave pods unready for seconds after they could
+    serve; probing is free in a test cluster. Once ready, a pod only turns
+    unready after a minute of failures, so a probe timing out on a loaded
+    CI node cannot drop a mock server from its Service mid-test.
+    
+    Args:
+        handler: Probe handler, e.g. tcp_socket=... or _exec=...
+        
+    Returns:
+        Probe for V1Container.readiness_probe
+    """
+    return client.V1Probe(
+        initial_delay_seconds=0,
+        period_seconds=1,
+        success_threshold=1,
+        failure_threshold=60,
+        timeout_seconds=1,
+        **handler
+    )
+
+
+def _watcher_config(labels: List[dict], log_level: str = "INFO") -> dict:
+    """
+    Build a watcher configuration from the shared template.
+    
+    Only the sections a fixture customizes are new objects; the rest are
+    shared with the template, so callers must not mutate "output" or
+    "resources.watchConfig".
+    
+    Args:
+        labels: Label selectors (with optional webhook requests)
+        log_level: Watcher log level
+        
+    Returns:
+        Configuration dictionary
+    """
+    return {
+        **_WATCHER_CONFIG_TEMPLATE,
+        "kubernetes": {"namespace": "default"},
+        "resources": {**_WATCHER_CONFIG_TEMPLATE["resources"], "labels": labels},
+        "logging": {**_WATCHER_CONFIG_TEMPLATE["logging"], "level": log_level}
+    }
+
+
+def _dump_config(cfg: dict) -> str:
+    """
+    Serialize a watcher configuration to YAML.
+    
+    Uses the libyaml-backed dumper when PyYAML was built with it, which is
+    several times faster than the pure-Python one.
+    
+    Args:
+        cfg: Configuration dictionary
+        
+    Returns:
+        YAML document
+    """
+    return yaml.dump(cfg, Dumper=_YAML_DUMPER)
+
+
+@functools.lru_cache(maxsize=4)
+def _watcher_pod_template(image: str) -> client.V1Pod:
+    """
+    Build the k8s-watcher Pod for an image.
+    
+    A bare Pod is used rather than a Deployment: a single test replica gains
+    nothing from the Deployment and ReplicaSet controllers, and the fixed
+    name saves looking the pod up by label. Only the mounted ConfigMap
+    content differs between fixtures, so the model tree is built once per
+    image and copied for each use.
+    
+    Args:
+        image: Watcher image name and tag
+        
+    Returns:
+        Pod object; callers must copy it before mutating
+    """
+    return client.V1Pod(
+        api_version="v1",
+        kind="Pod",
+        metadata=client.V1ObjectMeta(
+            name="k8s-watcher",
+            labels={"app": "k8s-watcher"}
+        ),
+        spec=client.V1PodSpec(
+            service_account_name="k8s-watcher",
+            termination_grace_period_seconds=1,
+            containers=[
+                client.V1Container(
+                    name="watcher",
+                    image=image,
+                    image_pull_policy="Never",  # Use local image
+                    args=["-config", "/etc/k8s-watcher/config.yaml"],
+                    # The watcher exposes no ready marker or health endpoint,
+                    # so a startup probe would have nothing better to check
+                    readiness_probe=_readiness_probe(
+                        _exec=client.V1ExecAction(
+                            command=["test", "-d", "/tmp/k8s-watcher-data"]
+                        )
+                    ),
+                    volume_mounts=[
+                        client.V1VolumeMount(
+                            name="config",
+                            mount_path="/etc/k8s-watcher"
+                        ),
+                        client.V1VolumeMount(
+                            name="data",
+                            mount_path="/tmp/k8s-watcher-data"
+                        )
+                    ]
+                )
+            ],
+            volumes=[
+                client.V1Volume(
+                    name="config",
+                    config_map=client.V1ConfigMapVolumeSource(
+                        name="watcher-config"
+                    )
+                ),
+                client.V1Volume(
+                    name="data",
+                    empty_dir=client.V1EmptyDirVolumeSource()
+                )
+            ]
         )
-        # Wait for cluster to be ready
-        time.sleep(5)
-    else:
-        print(f"\nUsing existing KinD cluster: {cluster_name}")
+    )
+
+
+def _build_watcher_manifests(
+    image: str
+) -> Tuple[client.V1ServiceAccount, client.V1Pod]:
+    """
+    Build the namespaced objects a watcher deployment needs.
     
-    yield cluster_name
+    RBAC is not included: read access is granted by the shared ClusterRole.
+    
+    Args:
+        image: Watcher image name and tag
+        
+    Returns:
+        Tuple of (ServiceAccount, Pod)
+    """
+    sa = client.V1ServiceAccount(
+        api_version="v1",
+        kind="ServiceAccount",
+        metadata=client.V1ObjectMeta(name="k8s-watcher")
+    )
+    return sa, copy.deepcopy(_watcher_pod_template(image))
+
+
+def _deploy_watcher(
+    api_clients: SimpleNamespace,
+    namespace: str,
+    image: str,
+    watcher_config: dict
+) -> dict:
+    """
+    Deploy k8s-watcher with a configuration and wait for its pod.
+    
+    Args:
+        api_clients: Shared Kubernetes API clients
+        namespace: Namespace to deploy to
+        image: Watcher image name and tag
+        watcher_config: Watcher configuration
+        
+    Returns:
+        Dictionary with deployment info (pod_name, namespace, and the pod
+        manifest for tests that need to recreate it)
+    """
+    k8s_client = api_clients.core
+    
+    # Create ConfigMap with watcher configuration
+    config_cm = client.V1ConfigMap(
+        api_version="v1",
+        kind="ConfigMap",
+        metadata=client.V1ObjectMeta(name="watcher-config"),
+        data={"config.yaml": _dump_config(watcher_config)}
+    )
+    sa, pod = _build_watcher_manifests(image)
+    pod_name = pod.metadata.name
+    
+    # Binds the shared ClusterRole to this namespace's watcher only, so a
+    # missing permission still fails the tests
+    role_binding = client.V1RoleBinding(
+        api_version="rbac.authorization.k8s.io/v1",
+        kind="RoleBinding",
+        metadata=client.V1ObjectMeta(name="k8s-watcher"),
+        role_ref=client.V1RoleRef(
+            api_group="rbac.authorization.k8s.io",
+            kind="ClusterRole",
+            name=WATCHER_CLUSTER_ROLE
+        ),
+        subjects=[
+            client.RbacV1Subject(
+                kind="ServiceAccount",
+                name=sa.metadata.name,
+                namespace=namespace
+            )
+        ]
+    )
+    
+    # The ConfigMap, ServiceAccount and RoleBinding are independent, so
+    # create them in parallel; the Pod is created once all exist
+    _create_concurrently(
+        lambda: _apply(
+            k8s_client.patch_namespaced_config_map,
+            config_cm,
+            namespace=namespace
+        ),
+        lambda: _apply(
+            k8s_client.patch_namespaced_service_account,
+            sa,
+            namespace=namespace
+        ),
+        lambda: _apply(
+            api_clients.rbac.patch_namespaced_role_binding,
+            role_binding,
+            namespace=namespace
+        )
+    )
+    
+    log.info("Deploying k8s-watcher to namespace: %s", namespace)
+    _apply(
+        k8s_client.patch_namespaced_pod,
+        pod,
+        namespace=namespace
+    )
+    
+    log.info("Waiting for pod %s to be ready...", pod_name)
+    ready, reason = wait_for_pod_ready(k8s_client, pod_name, namespace, timeout=60)
+    if not ready:
+        # Get logs for debugging
+        logs = get_pod_logs(k8s_client, pod_name, namespace)
+        log.error("Pod logs:\n%s", logs)
+        raise RuntimeError(f"Pod {pod_name} did not become ready: {reason}")
+    
+    log.info("Pod %s is ready", pod_name)
+    
+    return {
+        "pod_name": pod_name,
+        "namespace": namespace,
+        "pod": pod,
+        # Lets assert_watcher_alive skip the API round-trip while recent
+        "ready_at": time.monotonic()
+    }
+
+
+def _delete_namespace(k8s_client: client.CoreV1Api, namespace: str) -> None:
+    """Delete a namespace without waiting for its contents to be removed."""
+    try:
+        k8s_client.delete_namespace(
+            name=namespace,
+            body=client.V1DeleteOptions(
+                propagation_policy="Background",
+                grace_period_seconds=0
+            )
+        )
+    except Exception:
+        # Already gone, or the cluster is being torn down
+        pass
+
+
+def _drain_cleanup(timeout: int = 60) -> None:
+    """
+    Wait for queued namespace deletions to be issued.
+    
+    Args:
+        timeout: Maximum time to wait in seconds
+    """
+    wait(_CLEANUP_FUTURES, timeout=timeout)
+    _CLEANUP_FUTURES.clear()
+
+
+@contextlib.contextmanager
+def _session_lock() -> Iterator[None]:
+    """
+    Hold an exclusive lock shared by all xdist workers of the session.
+    
+    Without xdist there is a single process and the lock is uncontended.
+    """
+    os.makedirs(CERT_MANAGER_CACHE_DIR, exist_ok=True)
+    with open(SESSION_LOCK, "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _owns_shared_objects() -> bool:
+    """
+    Whether this process should tear down cluster-wide objects.
     
-    # Cleanup - delete cluster after all tests
-    # Comment out to keep cluster for debugging
-    print(f"\nDeleting KinD cluster: {cluster_name}")
+    xdist workers finish at different times, so they leave the cluster,
+    ClusterRole, cert-manager and certificate namespace to the controller,
+    which deletes the whole cluster once every worker is done.
+    """
+    return _XDIST_WORKER is None
+
+
+def _delete_kind_cluster(cluster_name: str) -> None:
+    """
+    Delete the KinD cluster and its sentinel.
+    
+    Both the kind_cluster teardown and, under xdist, pytest_sessionfinish
+    end up here, so KEEP_KIND_CLUSTER skips the deletion in either case.
+    """
+    if KEEP_KIND_CLUSTER:
+        log.info("Keeping KinD cluster: %s", cluster_name)
+        return
+    log.info("Deleting KinD cluster: %s", cluster_name)
     subprocess.run(["kind", "delete", "cluster", "--name", cluster_name])
+    try:
+        os.remove(CLUSTER_SENTINEL)
+    except OSError:
+        pass
+
+
+def _cert_manager_manifest() -> str:
+    """
+    Get the cert-manager install manifest, downloading it on first use.
+    
+    Release manifests are immutable, so the cached copy is keyed by version
+    only.
+    
+    Returns:
+        Path to the local manifest file
+    """
+    path = os.path.join(
+        CERT_MANAGER_CACHE_DIR,
+        f"cert-manager-{CERT_MANAGER_VERSION}.yaml"
+    )
+    if not os.path.exists(path):
+        os.makedirs(CERT_MANAGER_CACHE_DIR, exist_ok=True)
+        with urllib.request.urlopen(CERT_MANAGER_URL, timeout=60) as resp:
+            manifest = resp.read()
+        # Write to a temporary name first so an interrupted download is
+        # never mistaken for a complete manifest
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(manifest)
+        os.replace(tmp_path, path)
+    return path
+
+
+def _namespace_exists(v1: client.CoreV1Api, namespace: str) -> bool:
+    """
+    Check whether a namespace exists.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        namespace: Namespace name
+        
+    Returns:
+        True if the namespace exists, False otherwise
+    """
+    try:
+        v1.read_namespace(name=namespace)
+        return True
+    except client.exceptions.ApiException as e:
+        if e.status != 404:
+            raise
+        return False
+
+
+def _deployments_available(apps_v1: client.AppsV1Api, namespace: str) -> bool:
+    """
+    Check whether every Deployment in a namespace is rolled out and available.
+    
+    Args:
+        apps_v1: Kubernetes AppsV1Api client
+        namespace: Namespace to check
+        
+    Returns:
+        True if there is at least one Deployment and all are available
+    """
+    deployments = apps_v1.list_namespaced_deployment(namespace=namespace).items
+    if not deployments:
+        return False
+    
+    for deployment in deployments:
+        status = deployment.status
+        if (
+            status.observed_generation != deployment.metadata.generation
+            or (status.available_replicas or 0) < (deployment.spec.replicas or 0)
+        ):
+            return False
+    return True
+
+
+def _write_cluster_sentinel(cluster_name: str, v1: client.CoreV1Api) -> None:
+    """Record the running cluster in the sentinel file."""
+    try:
+        uid = _cluster_uid(v1)
+        with open(CLUSTER_SENTINEL, "w") as f:
+            f.write(f"{cluster_name} {uid}\n")
+    except Exception:
+        # The sentinel is only an optimization; a missing one means the
+        # next session falls back to the kind CLI
+        pass
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """
+    Make sure background namespace deletions finish before exiting.
+    
+    Under xdist the controller runs no fixtures, so it deletes the cluster
+    the workers shared once they have all finished.
+    """
+    _drain_cleanup()
+    
+    xdist_controller = (
+        getattr(session.config.option, "numprocesses", None)
+        and not hasattr(session.config, "workerinput")
+    )
+    if xdist_controller:
+        _delete_kind_cluster(CLUSTER_NAME)
+
+
+@pytest.fixture(scope="session")
+def kind_cluster() -> Generator[str, None, None]:
+    """
+    Create a KinD cluster for testing.
+    
+    Yields:
+        Cluster name
+    """
+    cluster_name = CLUSTER_NAME
+    config_path = os.path.join(os.path.dirname(__file__), "kind-config.yaml")
+    
+    # The first xdist worker creates the cluster; the others wait for it
+    # and reuse it
+    with _session_lock():
+        # Trust the sentinel from a previous session if the cluster it recorded
+        # is still reachable; only fall back to the kind CLI when it is stale
+        cluster_exists = _sentinel_cluster_alive(cluster_name)
+        
+        if not cluster_exists:
+            result = subprocess.run(
+                ["kind", "get", "clusters"],
+                capture_output=True,
+                text=True
+            )
+            cluster_exists = cluster_name in result.stdout.split()
+        
+        if not cluster_exists:
+            log.info("Creating KinD cluster: %s", cluster_name)
+            subprocess.run(
+                ["kind", "create", "cluster", "--config", config_path, "--name", cluster_name],
+                check=True
+            )
+        else:
+            log.info("Using existing KinD cluster: %s", cluster_name)
+    
+    # One client serves both the readiness wait and the sentinel
+    api_client = _kind_api_client(cluster_name)
+    try:
+        v1 = client.CoreV1Api(api_client)
+        if not wait_for_node_ready(v1, timeout=60):
+            raise RuntimeError(f"KinD cluster {cluster_name} node did not become ready in time")
+        _write_cluster_sentinel(cluster_name, v1)
+    finally:
+        api_client.close()
+    
+    yield cluster_name
+    
+    # Cleanup - delete cluster after all tests (unless KEEP_KIND_CLUSTER=1)
+    _drain_cleanup()
+    if _owns_shared_objects():
+        _delete_kind_cluster(cluster_name)
 
 
 @pytest.fixture(scope="session")
@@ -66,44 +874,220 @@ def docker_image(kind_cluster: str) -> Generator[str, None, None]:
     # Get the project root (two levels up from this file)
     project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
     
-    print(f"\nBuilding Docker image: {full_image}")
-    subprocess.run(
-        ["docker", "build", "-t", full_image, "."],
-        cwd=project_root,
-        check=True
+    src_hash = _source_hash(project_root)
+    # Later xdist workers find the image built by the first one
+    with _session_lock():
+        if _image_source_hash(full_image) == src_hash:
+            log.info("Docker image up to date: %s", full_image)
+        else:
+            log.info("Building Docker image: %s", full_image)
+            env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+            if _buildx_supports_cache_export():
+                # Persist the layer cache outside the daemon so it survives
+                # builder resets between sessions
+                build_cmd = [
+                    "docker", "buildx", "build",
+                    "--cache-from", f"type=local,src={BUILD_CACHE_DIR}",
+                    "--cache-to", f"type=local,dest={BUILD_CACHE_DIR},mode=max",
+                    "--load"
+                ]
+            else:
+                build_cmd = ["docker", "build"]
+            build_cmd += ["--label", f"src-hash={src_hash}", "-t", full_image, "."]
+            subprocess.run(build_cmd, cwd=project_root, env=env, check=True)
+    
+    yield full_image
+
+
+@pytest.fixture(scope="session")
+def images_loaded(kind_cluster: str, docker_image: str) -> List[str]:
+    """
+    Load the watcher and Mockolate images into KinD once per session.
+    
+    Every test pod uses image_pull_policy Never, so no test pays for a pull.
+    Both images are loaded in parallel, and an image the node already holds
+    is not loaded again.
+    
+    Args:
+        kind_cluster: KinD cluster name
+        docker_image: Watcher image name and tag
+        
+    Returns:
+        Images present in the KinD node
+    """
+    # A failed pull is not fatal if a local copy exists
+    subprocess.run(["docker", "pull", MOCK_SERVER_IMAGE])
+    
+    def load(image: str) -> None:
+        if _node_has_image(kind_cluster, image):
+            log.info("Image already present in KinD cluster: %s", image)
+            return
+        log.info("Loading image into KinD cluster: %s", image)
+        subprocess.run(
+            ["kind", "load", "docker-image", image, "--name", kind_cluster],
+            check=True
+        )
+    
+    images = [docker_image, MOCK_SERVER_IMAGE]
+    with _session_lock():
+        for future in [_SETUP_POOL.submit(load, image) for image in images]:
+            future.result()
+    return images
+
+
+@pytest.fixture(scope="session")
+def shared_infra(
+    kind_cluster: str,
+    docker_image: str,
+    images_loaded: List[str],
+    api_clients: SimpleNamespace
+) -> Generator[dict, None, None]:
+    """
+    Set up infrastructure shared by every watcher deployment in the session.
+    
+    The watcher only needs read access to ConfigMaps and Secrets, so a single
+    ClusterRole replaces the Role each test namespace used to create. Each
+    watcher deployment still binds it to its own ServiceAccount.
+    
+    Args:
+        kind_cluster: KinD cluster name
+        docker_image: Docker image name
+        images_loaded: Images preloaded into KinD
+        api_clients: Shared Kubernetes API clients
+        
+    Yields:
+        Dictionary with shared infra info (cluster, image, cluster_role)
+    """
+    rbac_v1 = api_clients.rbac
+    
+    cluster_role = client.V1ClusterRole(
+        api_version="rbac.authorization.k8s.io/v1",
+        kind="ClusterRole",
+        metadata=client.V1ObjectMeta(name=WATCHER_CLUSTER_ROLE),
+        rules=[
+            client.V1PolicyRule(
+                api_groups=[""],
+                resources=["configmaps", "secrets"],
+                verbs=["get", "list", "watch"]
+            )
+        ]
+    )
+    
+    # Applied rather than created, so a ClusterRole left over from a
+    # previous session that kept the cluster is simply updated
+    _apply(rbac_v1.patch_cluster_role, cluster_role)
+    
+    yield {
+        "cluster": kind_cluster,
+        "image": docker_image,
+        "cluster_role": WATCHER_CLUSTER_ROLE
+    }
+    
+    if not _owns_shared_objects():
+        return
+    
+    try:
+        rbac_v1.delete_cluster_role(name=WATCHER_CLUSTER_ROLE)
+    except client.exceptions.ApiException:
+        pass
+
+
+def _share_ssl_context(api_client: client.ApiClient) -> None:
+    """
+    Give every connection of an ApiClient's pool one prebuilt SSLContext.
+    
+    Given file paths, urllib3 builds a fresh context for each new
+    connection and re-reads the CA bundle and client key pair into it.
+    Loading them once into a shared context and handing only that to the
+    pool leaves each connection just the handshake.
+    
+    Args:
+        api_client: ApiClient whose pool has not opened a connection yet
+    """
+    configuration = api_client.configuration
+    if not configuration.verify_ssl:
+        return
+    
+    context = ssl.create_default_context(
+        cafile=configuration.ssl_ca_cert,
+        cadata=configuration.ca_cert_data
+    )
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file, configuration.key_file)
+    
+    pool_kw = api_client.rest_client.pool_manager.connection_pool_kw
+    for key in ("ca_certs", "ca_cert_data", "cert_file", "key_file"):
+        pool_kw.pop(key, None)
+    pool_kw["ssl_context"] = context
+
+
+@pytest.fixture(scope="session")
+def api_clients(kind_cluster: str) -> Generator[SimpleNamespace, None, None]:
+    """
+    Create Kubernetes API wrappers sharing one ApiClient.
+    
+    Every API group reuses the same urllib3 connection pool, so TLS
+    connections to the API server are set up once per session instead of
+    once per wrapper, all from one SSLContext. The kubeconfig is parsed
+    once into a private Configuration; the global default is left
+    untouched, so every API call must go through these clients.
+    
+    Args:
+        kind_cluster: KinD cluster name
+        
+    Yields:
+        Namespace with core, apps, rbac and custom (CustomObjectsApi) clients
+    """
+    configuration = client.Configuration()
+    configuration.connection_pool_maxsize = API_POOL_MAXSIZE
+    
+    # Load kubeconfig for the KinD cluster
+    api_client = config.new_client_from_config(
+        config_file=os.path.expanduser("~/.kube/config"),
+        context=f"kind-{kind_cluster}",
+        persist_config=False,
+        client_configuration=configuration
     )
+    _share_ssl_context(api_client)
     
-    print(f"\nLoading image into KinD cluster: {kind_cluster}")
-    subprocess.run(
-        ["kind", "load", "docker-image", full_image, "--name", kind_cluster],
-        check=True
+    yield SimpleNamespace(
+        core=client.CoreV1Api(api_client),
+        apps=client.AppsV1Api(api_client),
+        rbac=client.RbacAuthorizationV1Api(api_client),
+        custom=client.CustomObjectsApi(api_client)
     )
     
-    yield full_image
+    api_client.close()
 
 
 @pytest.fixture(scope="session")
-def k8s_client(kind_cluster: str) -> Generator[client.CoreV1Api, None, None]:
+def k8s_client(api_clients: SimpleNamespace) -> client.CoreV1Api:
     """
-    Create a Kubernetes API client for the KinD cluster.
+    Kubernetes CoreV1Api client for the KinD cluster.
     
     Args:
-        kind_cluster: KinD cluster name
+        api_clients: Shared Kubernetes API clients
         
-    Yields:
+    Returns:
         Kubernetes CoreV1Api client
     """
-    # Load kubeconfig for the KinD cluster
-    kubeconfig_path = os.path.expanduser("~/.kube/config")
-    config.load_kube_config(config_file=kubeconfig_path, context=f"kind-{kind_cluster}")
+    return api_clients.core
+
+
+@pytest.fixture(scope="session")
+def io_pool() -> ThreadPoolExecutor:
+    """
+    Thread pool for overlapping independent API calls and waits in tests.
     
-    yield client.CoreV1Api()
+    Returns:
+        The executor shared with fixture setup
+    """
+    return _SETUP_POOL
 
 
-@pytest.fixture
-def test_namespace(k8s_client: client.CoreV1Api) -> Generator[str, None, None]:
+def _namespace(k8s_client: client.CoreV1Api) -> Generator[str, None, None]:
     """
-    Create an isolated namespace for each test.
+    Create a uniquely named namespace, deleting it once the caller is done.
     
     Args:
         k8s_client: Kubernetes API client
@@ -111,12 +1095,11 @@ def test_namespace(k8s_client: client.CoreV1Api) -> Generator[str, None, None]:
     Yields:
         Namespace name
     """
-    import uuid
+    # Generate unique namespace name, tagged with the xdist worker that owns it
+    prefix = f"test-{_XDIST_WORKER}" if _XDIST_WORKER else "test"
+    namespace_name = f"{prefix}-{uuid.uuid4().hex[:8]}"
     
-    # Generate unique namespace name
-    namespace_name = f"test-{uuid.uuid4().hex[:8]}"
-    
-    print(f"\nCreating namespace: {namespace_name}")
+    log.info("Creating namespace: %s", namespace_name)
     
     # Create namespace
     namespace = client.V1Namespace(
@@ -124,20 +1107,73 @@ def test_namespace(k8s_client: client.CoreV1Api) -> Generator[str, None, None]:
     )
     k8s_client.create_namespace(body=namespace)
     
-    # Wait a bit for namespace to be active
-    time.sleep(1)
-    
     yield namespace_name
     
-    # Cleanup namespace
-    print(f"\nDeleting namespace: {namespace_name}")
-    try:
-        k8s_client.delete_namespace(
-            name=namespace_name,
-            body=client.V1DeleteOptions()
-        )
-    except client.exceptions.ApiException:
-        pass
+    # Cleanup namespace in the background; the API server garbage-collects
+    # its contents, so the next test doesn't wait for it
+    log.info("Deleting namespace: %s", namespace_name)
+    _CLEANUP_FUTURES.append(
+        _CLEANUP_POOL.submit(_delete_namespace, k8s_client, namespace_name)
+    )
+
+
+@pytest.fixture
+def test_namespace(k8s_client: client.CoreV1Api) -> Generator[str, None, None]:
+    """
+    Create an isolated namespace for each test.
+    
+    Args:
+        k8s_client: Kubernetes API client
+        
+    Yields:
+        Namespace name
+    """
+    yield from _namespace(k8s_client)
+
+
+@pytest.fixture(scope="session")
+def webhook_namespace(k8s_client: client.CoreV1Api) -> Generator[str, None, None]:
+    """
+    Namespace shared by the webhook tests and their watcher.
+    
+    The webhook watchers are deployed once per session, so their tests
+    share a namespace and keep apart through unique resource names.
+    
+    Args:
+        k8s_client: Kubernetes API client
+        
+    Yields:
+        Namespace name
+    """
+    yield from _namespace(k8s_client)
+
+
+@pytest.fixture(scope="session")
+def webhook_auth_namespace(k8s_client: client.CoreV1Api) -> Generator[str, None, None]:
+    """
+    Namespace shared by the basic auth webhook tests and their watcher.
+    
+    Args:
+        k8s_client: Kubernetes API client
+        
+    Yields:
+        Namespace name
+    """
+    yield from _namespace(k8s_client)
+
+
+@pytest.fixture(scope="session")
+def webhook_tls_namespace(k8s_client: client.CoreV1Api) -> Generator[str, None, None]:
+    """
+    Namespace shared by the TLS webhook tests and their watcher.
+    
+    Args:
+        k8s_client: Kubernetes API client
+        
+    Yields:
+        Namespace name
+    """
+    yield from _namespace(k8s_client)
 
 
 @pytest.fixture
@@ -148,209 +1184,45 @@ def watcher_config_basic() -> dict:
     Returns:
         Configuration dictionary
     """
-    return {
-        "output": {
-            "folder": "/tmp/k8s-watcher-data",
-            "folderAnnotation": "k8s-watcher-target-dir",
-            "uniqueFilenames": False,
-            "defaultFileMode": "0644"
-        },
-        "kubernetes": {
-            "namespace": "default"
-        },
-        "resources": {
-            "type": "both",
-            "method": "WATCH",
-            "watchConfig": {
-                "serverTimeout": 60,
-                "clientTimeout": 66,
-                "errorThrottleTime": 5,
-                "ignoreProcessed": True
-            },
-            "labels": [
-                {
-                    "name": "app",
-                    "value": "test"
-                }
-            ]
-        },
-        "logging": {
-            "level": "INFO",
-            "format": "LOGFMT"
-        }
-    }
+    return _watcher_config(
+        labels=[
+            {
+                "name": "app",
+                "value": "test"
+            }
+        ]
+    )
 
 
 @pytest.fixture
 def watcher_deployment(
-    k8s_client: client.CoreV1Api,
+    api_clients: SimpleNamespace,
     test_namespace: str,
-    docker_image: str,
+    shared_infra: dict,
     watcher_config_basic: dict
 ) -> Generator[dict, None, None]:
     """
     Deploy k8s-watcher to the test namespace.
     
     Args:
-        k8s_client: Kubernetes API client
+        api_clients: Shared Kubernetes API clients
         test_namespace: Test namespace
-        docker_image: Docker image name
+        shared_infra: Session-wide cluster, image and RBAC info
         watcher_config_basic: Basic watcher configuration
         
     Yields:
         Dictionary with deployment info (pod_name, namespace, etc.)
     """
-    import yaml
-    from helpers import wait_for_pod_ready
-    
     # Update config to use test namespace
     watcher_config_basic["kubernetes"]["namespace"] = test_namespace
     
-    # Create ConfigMap with watcher configuration
-    config_cm = client.V1ConfigMap(
-        metadata=client.V1ObjectMeta(name="watcher-config"),
-        data={"config.yaml": yaml.dump(watcher_config_basic)}
-    )
-    k8s_client.create_namespaced_config_map(
-        namespace=test_namespace,
-        body=config_cm
-    )
-    
-    # Create ServiceAccount
-    rbac_v1 = client.RbacAuthorizationV1Api()
-    sa = client.V1ServiceAccount(
-        metadata=client.V1ObjectMeta(name="k8s-watcher")
-    )
-    k8s_client.create_namespaced_service_account(
-        namespace=test_namespace,
-        body=sa
-    )
-    
-    # Create Role with permissions to read ConfigMaps and Secrets
-    role = client.V1Role(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        rules=[
-            client.V1PolicyRule(
-                api_groups=[""],
-                resources=["configmaps", "secrets"],
-                verbs=["get", "list", "watch"]
-            )
-        ]
-    )
-    rbac_v1.create_namespaced_role(
-        namespace=test_namespace,
-        body=role
-    )
-    
-    # Create RoleBinding
-    role_binding = client.V1RoleBinding(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        role_ref=client.V1RoleRef(
-            api_group="rbac.authorization.k8s.io",
-            kind="Role",
-            name="k8s-watcher"
-        ),
-        subjects=[
-            client.RbacV1Subject(
-                kind="ServiceAccount",
-                name="k8s-watcher",
-                namespace=test_namespace
-            )
-        ]
-    )
-    rbac_v1.create_namespaced_role_binding(
-        namespace=test_namespace,
-        body=role_binding
-    )
-    
-    # Create Deployment
-    apps_v1 = client.AppsV1Api()
-    deployment = client.V1Deployment(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        spec=client.V1DeploymentSpec(
-            replicas=1,
-            selector=client.V1LabelSelector(
-                match_labels={"app": "k8s-watcher"}
-            ),
-            template=client.V1PodTemplateSpec(
-                metadata=client.V1ObjectMeta(
-                    labels={"app": "k8s-watcher"}
-                ),
-                spec=client.V1PodSpec(
-                    service_account_name="k8s-watcher",
-                    containers=[
-                        client.V1Container(
-                            name="watcher",
-                            image=docker_image,
-                            image_pull_policy="Never",  # Use local image
-                            args=["-config", "/etc/k8s-watcher/config.yaml"],
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name="config",
-                                    mount_path="/etc/k8s-watcher"
-                                ),
-                                client.V1VolumeMount(
-                                    name="data",
-                                    mount_path="/tmp/k8s-watcher-data"
-                                )
-                            ]
-                        )
-                    ],
-                    volumes=[
-                        client.V1Volume(
-                            name="config",
-                            config_map=client.V1ConfigMapVolumeSource(
-                                name="watcher-config"
-                            )
-                        ),
-                        client.V1Volume(
-                            name="data",
-                            empty_dir=client.V1EmptyDirVolumeSource()
-                        )
-                    ]
-                )
-            )
-        )
-    )
-    
-    print(f"\nDeploying k8s-watcher to namespace: {test_namespace}")
-    apps_v1.create_namespaced_deployment(
-        namespace=test_namespace,
-        body=deployment
+    yield _deploy_watcher(
+        api_clients,
+        test_namespace,
+        shared_infra["image"],
+        watcher_config_basic
     )
     
-    # Wait for pod to be ready
-    time.sleep(2)
-    
-    # Get pod name
-    pods = k8s_client.list_namespaced_pod(
-        namespace=test_namespace,
-        label_selector="app=k8s-watcher"
-    )
-    
-    if not pods.items:
-        raise RuntimeError("k8s-watcher pod not found")
-    
-    pod_name = pods.items[0].metadata.name
-    
-    print(f"Waiting for pod {pod_name} to be ready...")
-    if not wait_for_pod_ready(k8s_client, pod_name, test_namespace, timeout=60):
-        # Get logs for debugging
-        from helpers import get_pod_logs
-        logs = get_pod_logs(k8s_client, pod_name, test_namespace)
-        print(f"Pod logs:\n{logs}")
-        raise RuntimeError(f"Pod {pod_name} did not become ready in time")
-    
-    print(f"Pod {pod_name} is ready")
-    
-    deployment_info = {
-        "pod_name": pod_name,
-        "namespace": test_namespace,
-        "deployment_name": "k8s-watcher"
-    }
-    
-    yield deployment_info
-    
     # Cleanup handled by namespace deletion
 
 
@@ -377,23 +1249,23 @@ def webhook_server(httpserver: HTTPServer) -> HTTPServer:
     return httpserver
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_webhook_server(
     k8s_client: client.CoreV1Api,
-    test_namespace: str
+    webhook_namespace: str,
+    images_loaded: List[str]
 ) -> Generator[dict, None, None]:
     """
     Deploy Mockolate mock HTTP server in the test namespace.
     
     Args:
         k8s_client: Kubernetes API client
-        test_namespace: Test namespace
+        webhook_namespace: Namespace shared by these tests
+        images_loaded: Images preloaded into KinD
         
     Yields:
         Dictionary with mock server info (service_name, url)
     """
-    from helpers import wait_for_pod_ready
-    
     # Create ConfigMap with Mockolate config
     mockolate_config = """
 endpoints:
@@ -409,29 +1281,39 @@ endpoints:
       status: 200
 """
     config_cm = client.V1ConfigMap(
+        api_version="v1",
+        kind="ConfigMap",
         metadata=client.V1ObjectMeta(name="mockolate-config"),
         data={"server.yaml": mockolate_config}
     )
-    k8s_client.create_namespaced_config_map(
-        namespace=test_namespace,
-        body=config_cm
-    )
+    _retry_namespace_race(lambda: _apply(
+        k8s_client.patch_namespaced_config_map,
+        config_cm,
+        namespace=webhook_namespace
+    ))
     
     # Create Mockolate Pod
     pod = client.V1Pod(
+        api_version="v1",
+        kind="Pod",
         metadata=client.V1ObjectMeta(
             name="mockolate",
             labels={"app": "mockolate"}
         ),
         spec=client.V1PodSpec(
+            termination_grace_period_seconds=1,
             containers=[
                 client.V1Container(
                     name="mockolate",
-                    image="nihalwasim/mock-http-server:latest",
-                    image_pull_policy="IfNotPresent",
+                    image=MOCK_SERVER_IMAGE,
+                    image_pull_policy="Never",  # Preloaded by images_loaded
                     ports=[
                         client.V1ContainerPort(container_port=8080)
                     ],
+                    # GET isn't routed by the mock config, so probe the socket
+                    readiness_probe=_readiness_probe(
+                        tcp_socket=client.V1TCPSocketAction(port=8080)
+                    ),
                     command=["/mock-server"],
                     args=["--server.config=/etc/config/server.yaml"],
                     volume_mounts=[
@@ -454,14 +1336,10 @@ endpoints:
         )
     )
     
-    print(f"\nDeploying Mockolate mock server to namespace: {test_namespace}")
-    k8s_client.create_namespaced_pod(
-        namespace=test_namespace,
-        body=pod
-    )
-    
     # Create Service for Mockolate
     service = client.V1Service(
+        api_version="v1",
+        kind="Service",
         metadata=client.V1ObjectMeta(name="mockolate"),
         spec=client.V1ServiceSpec(
             selector={"app": "mockolate"},
@@ -474,23 +1352,35 @@ endpoints:
             ]
         )
     )
-    k8s_client.create_namespaced_service(
-        namespace=test_namespace,
-        body=service
+    
+    # The Service only selects the pod by label, so both can be created
+    # at once
+    log.info("Deploying Mockolate mock server to namespace: %s", webhook_namespace)
+    _create_concurrently(
+        lambda: _apply(
+            k8s_client.patch_namespaced_pod,
+            pod,
+            namespace=webhook_namespace
+        ),
+        lambda: _apply(
+            k8s_client.patch_namespaced_service,
+            service,
+            namespace=webhook_namespace
+        )
     )
     
     # Wait for pod to be ready
-    print("Waiting for Mockolate pod to be ready...")
-    if not wait_for_pod_ready(k8s_client, "mockolate", test_namespace, timeout=60):
-        from helpers import get_pod_logs
-        logs = get_pod_logs(k8s_client, "mockolate", test_namespace)
-        print(f"Mockolate logs:\n{logs}")
-        raise RuntimeError("Mockolate pod did not become ready in time")
+    log.info("Waiting for Mockolate pod to be ready...")
+    ready, reason = wait_for_pod_ready(k8s_client, "mockolate", webhook_namespace, timeout=60)
+    if not ready:
+        logs = get_pod_logs(k8s_client, "mockolate", webhook_namespace)
+        log.error("Mockolate logs:\n%s", logs)
+        raise RuntimeError(f"Mockolate pod did not become ready: {reason}")
     
-    print("Mockolate mock server is ready")
+    log.info("Mockolate mock server is ready")
     
     # The service URL is: http://mockolate.<namespace>.svc.cluster.local:8080
-    service_url = f"http://mockolate.{test_namespace}.svc.cluster.local:8080"
+    service_url = f"http://mockolate.{webhook_namespace}.svc.cluster.local:8080"
     
     yield {
         "service_name": "mockolate",
@@ -501,245 +1391,86 @@ endpoints:
     # Cleanup handled by namespace deletion
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def watcher_config_webhook(mock_webhook_server: dict) -> dict:
     """
-    Watcher configuration with webhook enabled.
-    
-    Args:
-        mock_webhook_server: Mock webhook server info
-        
-    Returns:
-        Configuration dictionary with webhook
-    """
-    return {
-        "output": {
-            "folder": "/tmp/k8s-watcher-data",
-            "folderAnnotation": "k8s-watcher-target-dir",
-            "uniqueFilenames": False,
-            "defaultFileMode": "0644"
-        },
-        "kubernetes": {
-            "namespace": "default"
-        },
-        "resources": {
-            "type": "both",
-            "method": "WATCH",
-            "watchConfig": {
-                "serverTimeout": 60,
-                "clientTimeout": 66,
-                "errorThrottleTime": 5,
-                "ignoreProcessed": True
-            },
-            "labels": [
-                {
-                    "name": "app",
-                    "value": "webhook-test",
-                    "request": {
-                        "url": mock_webhook_server["webhook_endpoint"],
-                        "method": "POST",
-                        "timeout": 10,
-                        "retry": {
-                            "total": 3,
-                            "backoffFactor": 1.5
-                        }
-                    }
-                }
-            ]
-        },
-        "logging": {
-            "level": "DEBUG",
-            "format": "LOGFMT"
-        }
-    }
-
-
-@pytest.fixture
-def webhook_watcher_deployment(
-    k8s_client: client.CoreV1Api,
-    test_namespace: str,
-    docker_image: str,
-    watcher_config_webhook: dict
-) -> Generator[dict, None, None]:
-    """
-    Deploy k8s-watcher with webhook configuration.
-    
-    Args:
-        k8s_client: Kubernetes API client
-        test_namespace: Test namespace
-        docker_image: Docker image name
-        watcher_config_webhook: Watcher config with webhook
-        
-    Yields:
-        Dictionary with deployment info
-    """
-    import yaml
-    from helpers import wait_for_pod_ready
-    
-    # Update config to use test namespace
-    watcher_config_webhook["kubernetes"]["namespace"] = test_namespace
-    
-    # Create ConfigMap with watcher configuration
-    config_cm = client.V1ConfigMap(
-        metadata=client.V1ObjectMeta(name="watcher-config"),
-        data={"config.yaml": yaml.dump(watcher_config_webhook)}
-    )
-    k8s_client.create_namespaced_config_map(
-        namespace=test_namespace,
-        body=config_cm
-    )
-    
-    # Create ServiceAccount
-    rbac_v1 = client.RbacAuthorizationV1Api()
-    sa = client.V1ServiceAccount(
-        metadata=client.V1ObjectMeta(name="k8s-watcher")
-    )
-    k8s_client.create_namespaced_service_account(
-        namespace=test_namespace,
-        body=sa
-    )
-    
-    # Create Role
-    role = client.V1Role(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        rules=[
-            client.V1PolicyRule(
-                api_groups=[""],
-                resources=["configmaps", "secrets"],
-                verbs=["get", "list", "watch"]
-            )
-        ]
-    )
-    rbac_v1.create_namespaced_role(
-        namespace=test_namespace,
-        body=role
-    )
-    
-    # Create RoleBinding
-    role_binding = client.V1RoleBinding(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        role_ref=client.V1RoleRef(
-            api_group="rbac.authorization.k8s.io",
-            kind="Role",
-            name="k8s-watcher"
-        ),
-        subjects=[
-            client.RbacV1Subject(
-                kind="ServiceAccount",
-                name="k8s-watcher",
-                namespace=test_namespace
-            )
-        ]
-    )
-    rbac_v1.create_namespaced_role_binding(
-        namespace=test_namespace,
-        body=role_binding
-    )
-    
-    # Create Deployment
-    apps_v1 = client.AppsV1Api()
-    deployment = client.V1Deployment(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        spec=client.V1DeploymentSpec(
-            replicas=1,
-            selector=client.V1LabelSelector(
-                match_labels={"app": "k8s-watcher"}
-            ),
-            template=client.V1PodTemplateSpec(
-                metadata=client.V1ObjectMeta(
-                    labels={"app": "k8s-watcher"}
-                ),
-                spec=client.V1PodSpec(
-                    service_account_name="k8s-watcher",
-                    containers=[
-                        client.V1Container(
-                            name="watcher",
-                            image=docker_image,
-                            image_pull_policy="Never",
-                            args=["-config", "/etc/k8s-watcher/config.yaml"],
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name="config",
-                                    mount_path="/etc/k8s-watcher"
-                                ),
-                                client.V1VolumeMount(
-                                    name="data",
-                                    mount_path="/tmp/k8s-watcher-data"
-                                )
-                            ]
-                        )
-                    ],
-                    volumes=[
-                        client.V1Volume(
-                            name="config",
-                            config_map=client.V1ConfigMapVolumeSource(
-                                name="watcher-config"
-                            )
-                        ),
-                        client.V1Volume(
-                            name="data",
-                            empty_dir=client.V1EmptyDirVolumeSource()
-                        )
-                    ]
-                )
-            )
-        )
-    )
-    
-    print(f"\nDeploying k8s-watcher (with webhook) to namespace: {test_namespace}")
-    apps_v1.create_namespaced_deployment(
-        namespace=test_namespace,
-        body=deployment
-    )
-    
-    # Wait for pod to be ready
-    time.sleep(2)
+    Watcher configuration with webhook enabled.
     
-    pods = k8s_client.list_namespaced_pod(
-        namespace=test_namespace,
-        label_selector="app=k8s-watcher"
+    Args:
+        mock_webhook_server: Mock webhook server info
+        
+    Returns:
+        Configuration dictionary with webhook
+    """
+    return _watcher_config(
+        labels=[
+            {
+                "name": "app",
+                "value": "webhook-test",
+                "request": {
+                    "url": mock_webhook_server["webhook_endpoint"],
+                    "method": "POST",
+                    "timeout": 10,
+                    "retry": {
+                        "total": 3,
+                        "backoffFactor": 1.5
+                    }
+                }
+            }
+        ],
+        log_level="DEBUG"
     )
+
+
+@pytest.fixture(scope="session")
+def webhook_watcher_deployment(
+    api_clients: SimpleNamespace,
+    webhook_namespace: str,
+    shared_infra: dict,
+    watcher_config_webhook: dict
+) -> Generator[dict, None, None]:
+    """
+    Deploy k8s-watcher with webhook configuration.
     
-    if not pods.items:
-        raise RuntimeError("k8s-watcher pod not found")
-    
-    pod_name = pods.items[0].metadata.name
-    
-    print(f"Waiting for pod {pod_name} to be ready...")
-    if not wait_for_pod_ready(k8s_client, pod_name, test_namespace, timeout=60):
-        from helpers import get_pod_logs
-        logs = get_pod_logs(k8s_client, pod_name, test_namespace)
-        print(f"Pod logs:\n{logs}")
-        raise RuntimeError(f"Pod {pod_name} did not become ready in time")
-    
-    print(f"Pod {pod_name} is ready")
+    Args:
+        api_clients: Shared Kubernetes API clients
+        webhook_namespace: Namespace shared by these tests
+        shared_infra: Session-wide cluster, image and RBAC info
+        watcher_config_webhook: Watcher config with webhook
+        
+    Yields:
+        Dictionary with deployment info
+    """
+    # Update config to use the shared namespace
+    watcher_config_webhook["kubernetes"]["namespace"] = webhook_namespace
     
-    yield {
-        "pod_name": pod_name,
-        "namespace": test_namespace,
-        "deployment_name": "k8s-watcher"
-    }
+    yield _deploy_watcher(
+        api_clients,
+        webhook_namespace,
+        shared_infra["image"],
+        watcher_config_webhook
+    )
     
     # Cleanup handled by namespace deletion
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_webhook_server_auth(
     k8s_client: client.CoreV1Api,
-    test_namespace: str
+    webhook_auth_namespace: str,
+    images_loaded: List[str]
 ) -> Generator[dict, None, None]:
     """
     Deploy Mockolate with basic auth enabled.
     
     Args:
         k8s_client: Kubernetes API client
-        test_namespace: Test namespace
+        webhook_auth_namespace: Namespace shared by these tests
+        images_loaded: Images preloaded into KinD
         
     Yields:
         Dictionary with mock server info including auth credentials
     """
-    from helpers import wait_for_pod_ready
-    
     # Auth credentials
     auth_username = "testuser"
     auth_password = "testpass123"
@@ -754,29 +1485,39 @@ endpoints:
       status: 200
 """
     config_cm = client.V1ConfigMap(
+        api_version="v1",
+        kind="ConfigMap",
         metadata=client.V1ObjectMeta(name="mockolate-auth-config"),
         data={"server.yaml": mockolate_config}
     )
-    k8s_client.create_namespaced_config_map(
-        namespace=test_namespace,
-        body=config_cm
-    )
+    _retry_namespace_race(lambda: _apply(
+        k8s_client.patch_namespaced_config_map,
+        config_cm,
+        namespace=webhook_auth_namespace
+    ))
     
     # Create Mockolate Pod with basic auth enabled
     pod = client.V1Pod(
+        api_version="v1",
+        kind="Pod",
         metadata=client.V1ObjectMeta(
             name="mockolate-auth",
             labels={"app": "mockolate-auth"}
         ),
         spec=client.V1PodSpec(
+            termination_grace_period_seconds=1,
             containers=[
                 client.V1Container(
                     name="mockolate",
-                    image="nihalwasim/mock-http-server:latest",
-                    image_pull_policy="IfNotPresent",
+                    image=MOCK_SERVER_IMAGE,
+                    image_pull_policy="Never",  # Preloaded by images_loaded
                     ports=[
                         client.V1ContainerPort(container_port=8080)
                     ],
+                    # GET isn't routed by the mock config, so probe the socket
+                    readiness_probe=_readiness_probe(
+                        tcp_socket=client.V1TCPSocketAction(port=8080)
+                    ),
                     command=["/mock-server"],
                     args=[
                         "--server.config=/etc/config/server.yaml",
@@ -803,14 +1544,10 @@ endpoints:
         )
     )
     
-    print(f"\n🔐 Deploying Mockolate (with auth) to namespace: {test_namespace}")
-    k8s_client.create_namespaced_pod(
-        namespace=test_namespace,
-        body=pod
-    )
-    
     # Create Service
     service = client.V1Service(
+        api_version="v1",
+        kind="Service",
         metadata=client.V1ObjectMeta(name="mockolate-auth"),
         spec=client.V1ServiceSpec(
             selector={"app": "mockolate-auth"},
@@ -823,22 +1560,34 @@ endpoints:
             ]
         )
     )
-    k8s_client.create_namespaced_service(
-        namespace=test_namespace,
-        body=service
+    
+    # The Service only selects the pod by label, so both can be created
+    # at once
+    log.info("Deploying Mockolate (with auth) to namespace: %s", webhook_auth_namespace)
+    _create_concurrently(
+        lambda: _apply(
+            k8s_client.patch_namespaced_pod,
+            pod,
+            namespace=webhook_auth_namespace
+        ),
+        lambda: _apply(
+            k8s_client.patch_namespaced_service,
+            service,
+            namespace=webhook_auth_namespace
+        )
     )
     
     # Wait for pod to be ready
-    print("⏳ Waiting for Mockolate (auth) pod to be ready...")
-    if not wait_for_pod_ready(k8s_client, "mockolate-auth", test_namespace, timeout=60):
-        from helpers import get_pod_logs
-        logs = get_pod_logs(k8s_client, "mockolate-auth", test_namespace)
-        print(f"Mockolate logs:\n{logs}")
-        raise RuntimeError("Mockolate (auth) pod did not become ready in time")
+    log.info("Waiting for Mockolate (auth) pod to be ready...")
+    ready, reason = wait_for_pod_ready(k8s_client, "mockolate-auth", webhook_auth_namespace, timeout=60)
+    if not ready:
+        logs = get_pod_logs(k8s_client, "mockolate-auth", webhook_auth_namespace)
+        log.error("Mockolate logs:\n%s", logs)
+        raise RuntimeError(f"Mockolate (auth) pod did not become ready: {reason}")
     
-    print("✓ Mockolate (auth) mock server is ready")
+    log.info("Mockolate (auth) mock server is ready")
     
-    service_url = f"http://mockolate-auth.{test_namespace}.svc.cluster.local:8080"
+    service_url = f"http://mockolate-auth.{webhook_auth_namespace}.svc.cluster.local:8080"
     
     yield {
         "service_name": "mockolate-auth",
@@ -849,302 +1598,237 @@ endpoints:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def watcher_config_webhook_auth(mock_webhook_server_auth: dict) -> dict:
     """
     Watcher configuration with webhook and basic auth.
     """
-    return {
-        "output": {
-            "folder": "/tmp/k8s-watcher-data",
-            "folderAnnotation": "k8s-watcher-target-dir",
-            "uniqueFilenames": False,
-            "defaultFileMode": "0644"
-        },
-        "kubernetes": {
-            "namespace": "default"
-        },
-        "resources": {
-            "type": "both",
-            "method": "WATCH",
-            "watchConfig": {
-                "serverTimeout": 60,
-                "clientTimeout": 66,
-                "errorThrottleTime": 5,
-                "ignoreProcessed": True
-            },
-            "labels": [
-                {
-                    "name": "app",
-                    "value": "webhook-auth-test",
-                    "request": {
-                        "url": mock_webhook_server_auth["webhook_endpoint"],
-                        "method": "POST",
-                        "timeout": 10,
-                        "auth": {
-                            "basic": {
-                                "username": mock_webhook_server_auth["username"],
-                                "password": mock_webhook_server_auth["password"]
-                            }
-                        },
-                        "retry": {
-                            "total": 3,
-                            "backoffFactor": 1.5
+    return _watcher_config(
+        labels=[
+            {
+                "name": "app",
+                "value": "webhook-auth-test",
+                "request": {
+                    "url": mock_webhook_server_auth["webhook_endpoint"],
+                    "method": "POST",
+                    "timeout": 10,
+                    "auth": {
+                        "basic": {
+                            "username": mock_webhook_server_auth["username"],
+                            "password": mock_webhook_server_auth["password"]
                         }
+                    },
+                    "retry": {
+                        "total": 3,
+                        "backoffFactor": 1.5
                     }
                 }
-            ]
-        },
-        "logging": {
-            "level": "DEBUG",
-            "format": "LOGFMT"
-        }
-    }
+            }
+        ],
+        log_level="DEBUG"
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def webhook_watcher_deployment_auth(
-    k8s_client: client.CoreV1Api,
-    test_namespace: str,
-    docker_image: str,
+    api_clients: SimpleNamespace,
+    webhook_auth_namespace: str,
+    shared_infra: dict,
     watcher_config_webhook_auth: dict
 ) -> Generator[dict, None, None]:
     """
     Deploy k8s-watcher with webhook + basic auth configuration.
     """
-    import yaml
-    from helpers import wait_for_pod_ready
-    
-    watcher_config_webhook_auth["kubernetes"]["namespace"] = test_namespace
-    
-    config_cm = client.V1ConfigMap(
-        metadata=client.V1ObjectMeta(name="watcher-config"),
-        data={"config.yaml": yaml.dump(watcher_config_webhook_auth)}
-    )
-    k8s_client.create_namespaced_config_map(
-        namespace=test_namespace,
-        body=config_cm
-    )
-    
-    # Create RBAC resources
-    rbac_v1 = client.RbacAuthorizationV1Api()
-    sa = client.V1ServiceAccount(
-        metadata=client.V1ObjectMeta(name="k8s-watcher")
-    )
-    k8s_client.create_namespaced_service_account(
-        namespace=test_namespace,
-        body=sa
-    )
-    
-    role = client.V1Role(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        rules=[
-            client.V1PolicyRule(
-                api_groups=[""],
-                resources=["configmaps", "secrets"],
-                verbs=["get", "list", "watch"]
-            )
-        ]
-    )
-    rbac_v1.create_namespaced_role(
-        namespace=test_namespace,
-        body=role
-    )
-    
-    role_binding = client.V1RoleBinding(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        role_ref=client.V1RoleRef(
-            api_group="rbac.authorization.k8s.io",
-            kind="Role",
-            name="k8s-watcher"
-        ),
-        subjects=[
-            client.RbacV1Subject(
-                kind="ServiceAccount",
-                name="k8s-watcher",
-                namespace=test_namespace
-            )
-        ]
-    )
-    rbac_v1.create_namespaced_role_binding(
-        namespace=test_namespace,
-        body=role_binding
-    )
+    # Update config to use the shared namespace
+    watcher_config_webhook_auth["kubernetes"]["namespace"] = webhook_auth_namespace
     
-    # Create Deployment
-    apps_v1 = client.AppsV1Api()
-    deployment = client.V1Deployment(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        spec=client.V1DeploymentSpec(
-            replicas=1,
-            selector=client.V1LabelSelector(
-                match_labels={"app": "k8s-watcher"}
-            ),
-            template=client.V1PodTemplateSpec(
-                metadata=client.V1ObjectMeta(
-                    labels={"app": "k8s-watcher"}
-                ),
-                spec=client.V1PodSpec(
-                    service_account_name="k8s-watcher",
-                    containers=[
-                        client.V1Container(
-                            name="watcher",
-                            image=docker_image,
-                            image_pull_policy="Never",
-                            args=["-config", "/etc/k8s-watcher/config.yaml"],
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name="config",
-                                    mount_path="/etc/k8s-watcher"
-                                ),
-                                client.V1VolumeMount(
-                                    name="data",
-                                    mount_path="/tmp/k8s-watcher-data"
-                                )
-                            ]
-                        )
-                    ],
-                    volumes=[
-                        client.V1Volume(
-                            name="config",
-                            config_map=client.V1ConfigMapVolumeSource(
-                                name="watcher-config"
-                            )
-                        ),
-                        client.V1Volume(
-                            name="data",
-                            empty_dir=client.V1EmptyDirVolumeSource()
-                        )
-                    ]
-                )
-            )
-        )
+    yield _deploy_watcher(
+        api_clients,
+        webhook_auth_namespace,
+        shared_infra["image"],
+        watcher_config_webhook_auth
     )
     
-    print(f"\n🚀 Deploying k8s-watcher (with auth) to namespace: {test_namespace}")
-    apps_v1.create_namespaced_deployment(
-        namespace=test_namespace,
-        body=deployment
-    )
+    # Cleanup handled by namespace deletion
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cert_manager_apply(
+    request: pytest.FixtureRequest,
+    api_clients: SimpleNamespace
+) -> Generator[Optional[subprocess.Popen], None, None]:
+    """
+    Start installing cert-manager in the background as the session begins.
     
-    time.sleep(2)
+    The apply then overlaps the image build and load instead of blocking
+    the first TLS test. It is only started if a selected test needs
+    cert-manager and it is not installed yet.
     
-    pods = k8s_client.list_namespaced_pod(
-        namespace=test_namespace,
-        label_selector="app=k8s-watcher"
+    Args:
+        request: Pytest fixture request
+        api_clients: Shared Kubernetes API clients
+        
+    Yields:
+        The running kubectl apply, or None if nothing was started
+    """
+    # Tests that pick their watcher with getfixturevalue carry a "tls" mark
+    # instead of the fixture dependency
+    needed = any(
+        "cert_manager_installed" in getattr(item, "fixturenames", ())
+        or item.get_closest_marker("tls")
+        for item in request.session.items
+    )
+    if not needed or _namespace_exists(api_clients.core, "cert-manager"):
+        yield None
+        return
+    
+    log.info("Installing cert-manager...")
+    proc = subprocess.Popen(
+        ["kubectl", "apply", "--server-side", "-f", _cert_manager_manifest()],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
     )
     
-    if not pods.items:
-        raise RuntimeError("k8s-watcher pod not found")
-    
-    pod_name = pods.items[0].metadata.name
-    
-    print(f"⏳ Waiting for pod {pod_name} to be ready...")
-    if not wait_for_pod_ready(k8s_client, pod_name, test_namespace, timeout=60):
-        from helpers import get_pod_logs
-        logs = get_pod_logs(k8s_client, pod_name, test_namespace)
-        print(f"Pod logs:\n{logs}")
-        raise RuntimeError(f"Pod {pod_name} did not become ready in time")
-    
-    print(f"✓ Pod {pod_name} is ready")
+    yield proc
     
-    yield {
-        "pod_name": pod_name,
-        "namespace": test_namespace,
-        "deployment_name": "k8s-watcher"
-    }
+    # Don't leave the apply running if no test ended up waiting for it
+    proc.communicate()
 
 
 @pytest.fixture(scope="session")
-def cert_manager_installed(kind_cluster: str) -> Generator[bool, None, None]:
+def cert_manager_installed(
+    api_clients: SimpleNamespace,
+    cert_manager_apply: Optional[subprocess.Popen]
+) -> Generator[bool, None, None]:
     """
     Install cert-manager in the KinD cluster.
-    """
-    import subprocess
     
-    # Check if cert-manager is already installed
-    result = subprocess.run(
-        ["kubectl", "get", "namespace", "cert-manager"],
-        capture_output=True,
-        text=True
-    )
+    The installation state is read through the API rather than kubectl, and
+    the readiness waits are skipped when an existing installation is already
+    Available.
     
-    if result.returncode != 0:
-        print("\n📜 Installing cert-manager...")
-        subprocess.run(
-            ["kubectl", "apply", "-f", 
-             "https://github.com/cert-manager/cert-manager/releases/download/v1.14.0/cert-manager.yaml"],
-            check=True
-        )
-        
-        # Wait for cert-manager to be ready
-        print("⏳ Waiting for cert-manager to be ready...")
-        time.sleep(30)  # Give cert-manager time to start
+    Args:
+        api_clients: Shared Kubernetes API clients
+        cert_manager_apply: Background install started at session start
         
+    Yields:
+        True once cert-manager is ready
+    """
+    if cert_manager_apply is not None:
+        output, _ = cert_manager_apply.communicate()
+        if cert_manager_apply.returncode != 0:
+            raise RuntimeError(f"cert-manager install failed:\n{output}")
+        installed = False
+    else:
+        # Check if cert-manager is already installed
+        installed = _namespace_exists(api_clients.core, "cert-manager")
+        if not installed:
+            log.info("Installing cert-manager...")
+            subprocess.run(
+                ["kubectl", "apply", "--server-side", "-f", _cert_manager_manifest()],
+                check=True
+            )
+    
+    if installed and _deployments_available(api_clients.apps, "cert-manager"):
+        log.info("cert-manager already installed")
+    else:
+        # Wait for cert-manager to be ready; one kubectl wait covers the
+        # controller, cainjector and webhook Deployments
+        log.info("Waiting for cert-manager to be ready...")
         subprocess.run(
-            ["kubectl", "wait", "--for=condition=Available", 
-             "deployment/cert-manager-webhook", "-n", "cert-manager", 
-             "--timeout=120s"],
+            ["kubectl", "wait", "--for=condition=Available", "--all",
+             "deployment", "-n", "cert-manager", "--timeout=120s"],
             check=True
         )
-        print("✓ cert-manager installed and ready")
-    else:
-        print("\n✓ cert-manager already installed")
-    
+        
+        # An Available webhook may still lack its CA bundle; wait until it
+        # admits a server-side dry-run Issuer
+        deadline = time.time() + 60
+        while True:
+            try:
+                api_clients.custom.create_namespaced_custom_object(
+                    group="cert-manager.io",
+                    version="v1",
+                    namespace="cert-manager",
+                    plural="issuers",
+                    body=dict(_CERT_MANAGER_PROBE_ISSUER),
+                    dry_run="All"
+                )
+                break
+            except client.exceptions.ApiException as e:
+                if time.time() > deadline:
+                    raise RuntimeError(f"cert-manager webhook not ready: {e.reason}")
+            time.sleep(1)
+        log.info("cert-manager installed and ready")
     
     yield True
     
+    if not _owns_shared_objects():
+        return
+    
     # Cleanup cert-manager
-    print("\n🗑️  Uninstalling cert-manager...")
+    log.info("Uninstalling cert-manager...")
     subprocess.run(
-        ["kubectl", "delete", "-f", 
-         "https://github.com/cert-manager/cert-manager/releases/download/v1.14.0/cert-manager.yaml"],
+        ["kubectl", "delete", "-f", _cert_manager_manifest()],
         check=False  # Don't fail if already deleted or cluster is gone
     )
-    print("✓ cert-manager uninstalled")
+    log.info("cert-manager uninstalled")
 
 
-@pytest.fixture
-def mock_webhook_server_tls(
-    k8s_client: client.CoreV1Api,
-    test_namespace: str,
+@pytest.fixture(scope="session")
+def mockolate_tls_secret(
+    api_clients: SimpleNamespace,
     cert_manager_installed: bool
 ) -> Generator[dict, None, None]:
     """
-    Deploy Mockolate with TLS using cert-manager.
+    Issue the Mockolate TLS key pair once per session with cert-manager.
+    
+    The certificate is minted in a namespace of its own and its Secret data
+    is copied into the TLS test namespace, so cert-manager generates one key
+    pair per session instead of one per test. Its SAN cannot name every test
+    namespace's Service; the watcher skips verification of the self-signed
+    certificate anyway.
+    
+    Args:
+        api_clients: Shared Kubernetes API clients
+        cert_manager_installed: Ensures cert-manager is installed
+        
+    Yields:
+        Data of the kubernetes.io/tls Secret issued by cert-manager
     """
-    from helpers import wait_for_pod_ready
+    custom_api = api_clients.custom
+    
+    # Applied, so a namespace left by a session that kept the cluster is reused
+    _apply(
+        api_clients.core.patch_namespace,
+        client.V1Namespace(
+            api_version="v1",
+            kind="Namespace",
+            metadata=client.V1ObjectMeta(name=TLS_CERT_NAMESPACE)
+        )
+    )
     
     # Create a self-signed Issuer
-    custom_api = client.CustomObjectsApi()
-    
     issuer = {
         "apiVersion": "cert-manager.io/v1",
         "kind": "Issuer",
         "metadata": {
             "name": "selfsigned-issuer",
-            "namespace": test_namespace
+            "namespace": TLS_CERT_NAMESPACE
         },
         "spec": {
             "selfSigned": {}
         }
     }
     
-    custom_api.create_namespaced_custom_object(
-        group="cert-manager.io",
-        version="v1",
-        namespace=test_namespace,
-        plural="issuers",
-        body=issuer
-    )
-    
     # Create Certificate
     certificate = {
         "apiVersion": "cert-manager.io/v1",
         "kind": "Certificate",
         "metadata": {
             "name": "mockolate-tls",
-            "namespace": test_namespace
+            "namespace": TLS_CERT_NAMESPACE
         },
         "spec": {
             "secretName": "mockolate-tls-secret",
@@ -1155,23 +1839,67 @@ def mock_webhook_server_tls(
                 "kind": "Issuer"
             },
             "dnsNames": [
-                f"mockolate-tls.{test_namespace}.svc.cluster.local",
                 "mockolate-tls"
             ]
         }
     }
     
-    custom_api.create_namespaced_custom_object(
-        group="cert-manager.io",
-        version="v1",
-        namespace=test_namespace,
-        plural="certificates",
-        body=certificate
+    # cert-manager reconciles the Certificate once the Issuer exists, so
+    # the two need not be created in order
+    _create_concurrently(
+        lambda: _apply(
+            custom_api.patch_namespaced_custom_object,
+            issuer,
+            group="cert-manager.io",
+            version="v1",
+            namespace=TLS_CERT_NAMESPACE,
+            plural="issuers"
+        ),
+        lambda: _apply(
+            custom_api.patch_namespaced_custom_object,
+            certificate,
+            group="cert-manager.io",
+            version="v1",
+            namespace=TLS_CERT_NAMESPACE,
+            plural="certificates"
+        )
     )
     
     # Wait for certificate to be ready
-    print("⏳ Waiting for TLS certificate to be ready...")
-    time.sleep(10)
+    log.info("Waiting for TLS certificate to be ready...")
+    if not wait_cert_ready(custom_api, "mockolate-tls", TLS_CERT_NAMESPACE):
+        raise RuntimeError("TLS certificate did not become ready in time")
+    
+    secret = api_clients.core.read_namespaced_secret(
+        name="mockolate-tls-secret",
+        namespace=TLS_CERT_NAMESPACE
+    )
+    
+    yield secret.data
+    
+    if _owns_shared_objects():
+        _delete_namespace(api_clients.core, TLS_CERT_NAMESPACE)
+
+
+@pytest.fixture(scope="session")
+def mock_webhook_server_tls(
+    api_clients: SimpleNamespace,
+    webhook_tls_namespace: str,
+    images_loaded: List[str],
+    mockolate_tls_secret: dict
+) -> Generator[dict, None, None]:
+    """
+    Deploy Mockolate with TLS, using the session's cert-manager key pair.
+    """
+    k8s_client = api_clients.core
+    
+    tls_secret = client.V1Secret(
+        api_version="v1",
+        kind="Secret",
+        metadata=client.V1ObjectMeta(name="mockolate-tls-secret"),
+        type="kubernetes.io/tls",
+        data=mockolate_tls_secret
+    )
     
     # Create ConfigMap with Mockolate config
     mockolate_config = """
@@ -1183,29 +1911,46 @@ endpoints:
       status: 200
 """
     config_cm = client.V1ConfigMap(
+        api_version="v1",
+        kind="ConfigMap",
         metadata=client.V1ObjectMeta(name="mockolate-tls-config"),
         data={"server.yaml": mockolate_config}
     )
-    k8s_client.create_namespaced_config_map(
-        namespace=test_namespace,
-        body=config_cm
+    _create_concurrently(
+        lambda: _apply(
+            k8s_client.patch_namespaced_secret,
+            tls_secret,
+            namespace=webhook_tls_namespace
+        ),
+        lambda: _apply(
+            k8s_client.patch_namespaced_config_map,
+            config_cm,
+            namespace=webhook_tls_namespace
+        )
     )
     
     # Create Mockolate Pod with TLS
     pod = client.V1Pod(
+        api_version="v1",
+        kind="Pod",
         metadata=client.V1ObjectMeta(
             name="mockolate-tls",
             labels={"app": "mockolate-tls"}
         ),
         spec=client.V1PodSpec(
+            termination_grace_period_seconds=1,
             containers=[
                 client.V1Container(
                     name="mockolate",
-                    image="nihalwasim/mock-http-server:latest",
-                    image_pull_policy="IfNotPresent",
+                    image=MOCK_SERVER_IMAGE,
+                    image_pull_policy="Never",  # Preloaded by images_loaded
                     ports=[
                         client.V1ContainerPort(container_port=8443)
                     ],
+                    # GET isn't routed by the mock config, so probe the socket
+                    readiness_probe=_readiness_probe(
+                        tcp_socket=client.V1TCPSocketAction(port=8443)
+                    ),
                     command=["/mock-server"],
                     args=[
                         "--server.config=/etc/config/server.yaml",
@@ -1245,14 +1990,10 @@ endpoints:
         )
     )
     
-    print(f"\n🔒 Deploying Mockolate (TLS) to namespace: {test_namespace}")
-    k8s_client.create_namespaced_pod(
-        namespace=test_namespace,
-        body=pod
-    )
-    
     # Create Service
     service = client.V1Service(
+        api_version="v1",
+        kind="Service",
         metadata=client.V1ObjectMeta(name="mockolate-tls"),
         spec=client.V1ServiceSpec(
             selector={"app": "mockolate-tls"},
@@ -1265,22 +2006,34 @@ endpoints:
             ]
         )
     )
-    k8s_client.create_namespaced_service(
-        namespace=test_namespace,
-        body=service
+    
+    # The Service only selects the pod by label, so both can be created
+    # at once
+    log.info("Deploying Mockolate (TLS) to namespace: %s", webhook_tls_namespace)
+    _create_concurrently(
+        lambda: _apply(
+            k8s_client.patch_namespaced_pod,
+            pod,
+            namespace=webhook_tls_namespace
+        ),
+        lambda: _apply(
+            k8s_client.patch_namespaced_service,
+            service,
+            namespace=webhook_tls_namespace
+        )
     )
     
     # Wait for pod
-    print("⏳ Waiting for Mockolate (TLS) pod to be ready...")
-    if not wait_for_pod_ready(k8s_client, "mockolate-tls", test_namespace, timeout=60):
-        from helpers import get_pod_logs
-        logs = get_pod_logs(k8s_client, "mockolate-tls", test_namespace)
-        print(f"Mockolate logs:\n{logs}")
-        raise RuntimeError("Mockolate (TLS) pod did not become ready in time")
+    log.info("Waiting for Mockolate (TLS) pod to be ready...")
+    ready, reason = wait_for_pod_ready(k8s_client, "mockolate-tls", webhook_tls_namespace, timeout=60)
+    if not ready:
+        logs = get_pod_logs(k8s_client, "mockolate-tls", webhook_tls_namespace)
+        log.error("Mockolate logs:\n%s", logs)
+        raise RuntimeError(f"Mockolate (TLS) pod did not become ready: {reason}")
     
-    print("✓ Mockolate (TLS) mock server is ready")
+    log.info("Mockolate (TLS) mock server is ready")
     
-    service_url = f"https://mockolate-tls.{test_namespace}.svc.cluster.local:8443"
+    service_url = f"https://mockolate-tls.{webhook_tls_namespace}.svc.cluster.local:8443"
     
     yield {
         "service_name": "mockolate-tls",
@@ -1289,202 +2042,51 @@ endpoints:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def watcher_config_webhook_tls(mock_webhook_server_tls: dict) -> dict:
     """
     Watcher configuration with HTTPS webhook (skipTLSVerify: true for self-signed).
     """
-    return {
-        "output": {
-            "folder": "/tmp/k8s-watcher-data",
-            "folderAnnotation": "k8s-watcher-target-dir",
-            "uniqueFilenames": False,
-            "defaultFileMode": "0644"
-        },
-        "kubernetes": {
-            "namespace": "default"
-        },
-        "resources": {
-            "type": "both",
-            "method": "WATCH",
-            "watchConfig": {
-                "serverTimeout": 60,
-                "clientTimeout": 66,
-                "errorThrottleTime": 5,
-                "ignoreProcessed": True
-            },
-            "labels": [
-                {
-                    "name": "app",
-                    "value": "webhook-tls-test",
-                    "request": {
-                        "url": mock_webhook_server_tls["webhook_endpoint"],
-                        "method": "POST",
-                        "timeout": 10,
-                        "skipTLSVerify": True,  # Required for self-signed certs
-                        "retry": {
-                            "total": 3,
-                            "backoffFactor": 1.5
-                        }
+    return _watcher_config(
+        labels=[
+            {
+                "name": "app",
+                "value": "webhook-tls-test",
+                "request": {
+                    "url": mock_webhook_server_tls["webhook_endpoint"],
+                    "method": "POST",
+                    "timeout": 10,
+                    "skipTLSVerify": True,  # Required for self-signed certs
+                    "retry": {
+                        "total": 3,
+                        "backoffFactor": 1.5
                     }
                 }
-            ]
-        },
-        "logging": {
-            "level": "DEBUG",
-            "format": "LOGFMT"
-        }
-    }
+            }
+        ],
+        log_level="DEBUG"
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def webhook_watcher_deployment_tls(
-    k8s_client: client.CoreV1Api,
-    test_namespace: str,
-    docker_image: str,
+    api_clients: SimpleNamespace,
+    webhook_tls_namespace: str,
+    shared_infra: dict,
     watcher_config_webhook_tls: dict
 ) -> Generator[dict, None, None]:
     """
     Deploy k8s-watcher with TLS webhook configuration.
     """
-    import yaml
-    from helpers import wait_for_pod_ready
-    
-    watcher_config_webhook_tls["kubernetes"]["namespace"] = test_namespace
-    
-    config_cm = client.V1ConfigMap(
-        metadata=client.V1ObjectMeta(name="watcher-config"),
-        data={"config.yaml": yaml.dump(watcher_config_webhook_tls)}
-    )
-    k8s_client.create_namespaced_config_map(
-        namespace=test_namespace,
-        body=config_cm
-    )
-    
-    # Create RBAC resources
-    rbac_v1 = client.RbacAuthorizationV1Api()
-    sa = client.V1ServiceAccount(
-        metadata=client.V1ObjectMeta(name="k8s-watcher")
-    )
-    k8s_client.create_namespaced_service_account(
-        namespace=test_namespace,
-        body=sa
-    )
-    
-    role = client.V1Role(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        rules=[
-            client.V1PolicyRule(
-                api_groups=[""],
-                resources=["configmaps", "secrets"],
-                verbs=["get", "list", "watch"]
-            )
-        ]
-    )
-    rbac_v1.create_namespaced_role(
-        namespace=test_namespace,
-        body=role
-    )
-    
-    role_binding = client.V1RoleBinding(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        role_ref=client.V1RoleRef(
-            api_group="rbac.authorization.k8s.io",
-            kind="Role",
-            name="k8s-watcher"
-        ),
-        subjects=[
-            client.RbacV1Subject(
-                kind="ServiceAccount",
-                name="k8s-watcher",
-                namespace=test_namespace
-            )
-        ]
-    )
-    rbac_v1.create_namespaced_role_binding(
-        namespace=test_namespace,
-        body=role_binding
-    )
-    
-    # Create Deployment
-    apps_v1 = client.AppsV1Api()
-    deployment = client.V1Deployment(
-        metadata=client.V1ObjectMeta(name="k8s-watcher"),
-        spec=client.V1DeploymentSpec(
-            replicas=1,
-            selector=client.V1LabelSelector(
-                match_labels={"app": "k8s-watcher"}
-            ),
-            template=client.V1PodTemplateSpec(
-                metadata=client.V1ObjectMeta(
-                    labels={"app": "k8s-watcher"}
-                ),
-                spec=client.V1PodSpec(
-                    service_account_name="k8s-watcher",
-                    containers=[
-                        client.V1Container(
-                            name="watcher",
-                            image=docker_image,
-                            image_pull_policy="Never",
-                            args=["-config", "/etc/k8s-watcher/config.yaml"],
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name="config",
-                                    mount_path="/etc/k8s-watcher"
-                                ),
-                                client.V1VolumeMount(
-                                    name="data",
-                                    mount_path="/tmp/k8s-watcher-data"
-                                )
-                            ]
-                        )
-                    ],
-                    volumes=[
-                        client.V1Volume(
-                            name="config",
-                            config_map=client.V1ConfigMapVolumeSource(
-                                name="watcher-config"
-                            )
-                        ),
-                        client.V1Volume(
-                            name="data",
-                            empty_dir=client.V1EmptyDirVolumeSource()
-                        )
-                    ]
-                )
-            )
-        )
-    )
+    # Update config to use the shared namespace
+    watcher_config_webhook_tls["kubernetes"]["namespace"] = webhook_tls_namespace
     
-    print(f"\n🚀 Deploying k8s-watcher (TLS) to namespace: {test_namespace}")
-    apps_v1.create_namespaced_deployment(
-        namespace=test_namespace,
-        body=deployment
+    yield _deploy_watcher(
+        api_clients,
+        webhook_tls_namespace,
+        shared_infra["image"],
+        watcher_config_webhook_tls
     )
     
-    time.sleep(2)
-    
-    pods = k8s_client.list_namespaced_pod(
-        namespace=test_namespace,
-        label_selector="app=k8s-watcher"
-    )
-    
-    if not pods.items:
-        raise RuntimeError("k8s-watcher pod not found")
-    
-    pod_name = pods.items[0].metadata.name
-    
-    print(f"⏳ Waiting for pod {pod_name} to be ready...")
-    if not wait_for_pod_ready(k8s_client, pod_name, test_namespace, timeout=60):
-        from helpers import get_pod_logs
-        logs = get_pod_logs(k8s_client, pod_name, test_namespace)
-        print(f"Pod logs:\n{logs}")
-        raise RuntimeError(f"Pod {pod_name} did not become ready in time")
-    
-    print(f"✓ Pod {pod_name} is ready")
-    
-    yield {
-        "pod_name": pod_name,
-        "namespace": test_namespace,
-        "deployment_name": "k8s-watcher"
-    }
+    # Cleanup handled by namespace deletion
+
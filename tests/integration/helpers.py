@@ -1,21 +1,240 @@
 """Helper utilities for k8s-watcher integration tests."""
 
+import base64
+import io
+import logging
+import re
+import shlex
+import tarfile
 import time
 import subprocess
-from typing import Optional, Dict, Any
-from kubernetes import client
+import uuid
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Callable, List, Tuple, Union
+from kubernetes import client, watch
 from kubernetes.stream import stream
 
 
+log = logging.getLogger(__name__)
+
+# Container waiting reasons that will not resolve without intervention
+# (ErrImageNeverPull is what images with pullPolicy Never report when the
+# image was not loaded into KinD)
+TERMINAL_REASONS = frozenset({
+    "CrashLoopBackOff",
+    "ImagePullBackOff",
+    "ErrImagePull",
+    "ErrImageNeverPull"
+})
+
+# Name of the resource in each of the watcher's "Processing resource" lines
+_PROCESSING_RE = re.compile(r'msg="Processing resource" .*\bname=(\S+)')
+
+
+@dataclass(frozen=True)
+class SyncCase:
+    """
+    A single-file sync case for the parametrized ConfigMap and Secret tests.
+    
+    Attributes:
+        name: Resource name, also used as the test ID
+        labels: Labels on the resource
+        data: Resource data (bytes values for Secrets)
+        path: Expected file path; {namespace} is replaced by the test namespace
+        content: Expected file content
+        should_sync: Whether the watcher is expected to write the file
+        annotations: Annotations on the resource
+    """
+    name: str
+    labels: Dict[str, str]
+    data: Dict[str, Any]
+    path: str
+    content: Optional[str] = None
+    should_sync: bool = True
+    annotations: Dict[str, str] = field(default_factory=dict)
+
+
+def wait_for_node_ready(v1: client.CoreV1Api, timeout: int = 60) -> bool:
+    """
+    Wait for a cluster node to report Ready.
+    
+    Uses a watch so the API server pushes the condition change instead of
+    the client polling for it.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        True if a node became ready, False otherwise
+    """
+    w = watch.Watch()
+    try:
+        for event in w.stream(v1.list_node, timeout_seconds=timeout):
+            node = event["object"]
+            for condition in node.status.conditions or []:
+                if condition.type == "Ready" and condition.status == "True":
+                    return True
+    except client.exceptions.ApiException:
+        pass
+    finally:
+        w.stop()
+    
+    return False
+
+
+def wait_for_pod_by_label(
+    v1: client.CoreV1Api,
+    namespace: str,
+    label_selector: str,
+    timeout: int = 30
+) -> Optional[str]:
+    """
+    Wait for a pod matching a label selector to be created.
+    
+    Failed pods are filtered out server-side, so a pod left over from an
+    earlier rollout is never returned.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        namespace: Namespace to watch
+        label_selector: Label selector of the pod
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        Name of the first matching pod, or None if none appeared in time
+    """
+    w = watch.Watch()
+    try:
+        for event in w.stream(
+            v1.list_namespaced_pod,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector="status.phase!=Failed",
+            timeout_seconds=timeout
+        ):
+            if event["type"] == "ADDED":
+                return event["object"].metadata.name
+    except client.exceptions.ApiException:
+        pass
+    finally:
+        w.stop()
+    
+    return None
+
+
+def restart_pod(
+    v1: client.CoreV1Api,
+    pod: client.V1Pod,
+    namespace: str,
+    timeout: int = 90
+) -> Tuple[bool, str]:
+    """
+    Delete a bare pod, recreate it from its manifest and wait until it is ready.
+    
+    One watch on the pod (filtered server-side by name) sees both the
+    DELETED event and the new pod's way to readiness. It starts at the
+    pod's current resourceVersion, so the deletion cannot be missed between
+    the read and the watch.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod: Manifest the pod was created from
+        namespace: Namespace of the pod
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        Tuple of (ready, reason); reason is empty if the new pod became ready
+        and otherwise the terminal waiting reason or "timeout"
+    """
+    pod_name = pod.metadata.name
+    current = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
+    v1.delete_namespaced_pod(
+        name=pod_name,
+        namespace=namespace,
+        body=client.V1DeleteOptions(grace_period_seconds=0)
+    )
+    
+    recreated = False
+    w = watch.Watch()
+    try:
+        for event in w.stream(
+            v1.list_namespaced_pod,
+            namespace=namespace,
+            field_selector=f"metadata.name={pod_name}",
+            resource_version=current.metadata.resource_version,
+            timeout_seconds=timeout
+        ):
+            if not recreated:
+                if event["type"] == "DELETED":
+                    v1.create_namespaced_pod(namespace=namespace, body=pod)
+                    recreated = True
+                continue
+            if is_pod_ready(event["object"]):
+                return True, ""
+            reason = pod_terminal_reason(event["object"])
+            if reason:
+                return False, reason
+    except client.exceptions.ApiException:
+        pass
+    finally:
+        w.stop()
+    
+    return False, "timeout" if recreated else "not deleted"
+
+
+def is_pod_ready(pod: client.V1Pod) -> bool:
+    """
+    Check whether a pod reports the Ready condition.
+    
+    The kubelet sets Ready once every container passes its readiness probe,
+    so this covers both the phase and per-container checks.
+    
+    Args:
+        pod: Pod object
+        
+    Returns:
+        True if the pod is ready, False otherwise
+    """
+    for condition in (pod.status and pod.status.conditions) or []:
+        if condition.type == "Ready" and condition.status == "True":
+            return True
+    return False
+
+
+def pod_terminal_reason(pod: client.V1Pod) -> Optional[str]:
+    """
+    Find a container waiting reason that means the pod will never be ready.
+    
+    Args:
+        pod: Pod object
+        
+    Returns:
+        The first reason found in TERMINAL_REASONS, or None
+    """
+    for status in (pod.status and pod.status.container_statuses) or []:
+        waiting = status.state and status.state.waiting
+        if waiting and waiting.reason in TERMINAL_REASONS:
+            return waiting.reason
+    return None
+
+
 def wait_for_pod_ready(
     v1: client.CoreV1Api,
     pod_name: str,
     namespace: str,
     timeout: int = 60
-) -> bool:
+) -> Tuple[bool, str]:
     """
     Wait for a pod to be ready.
     
+    A single watch on the pod (filtered server-side by name) replaces
+    repeated GETs, so readiness is seen as soon as the API server has it.
+    The wait is abandoned as soon as a container enters a terminal waiting
+    state such as CrashLoopBackOff, rather than at the timeout. If the watch
+    itself fails, the pod is polled once per second instead.
+    
     Args:
         v1: Kubernetes CoreV1Api client
         pod_name: Name of the pod
@@ -23,32 +242,241 @@ def wait_for_pod_ready(
         timeout: Maximum time to wait in seconds
         
     Returns:
-        True if pod became ready, False otherwise
+        Tuple of (ready, reason); reason is empty if the pod became ready and
+        otherwise the terminal waiting reason or "timeout"
     """
-    start_time = time.time()
+    deadline = time.time() + timeout
+    w = watch.Watch()
+    try:
+        for event in w.stream(
+            v1.list_namespaced_pod,
+            namespace=namespace,
+            field_selector=f"metadata.name={pod_name}",
+            timeout_seconds=timeout
+        ):
+            pod = event["object"]
+            if is_pod_ready(pod):
+                return True, ""
+            reason = pod_terminal_reason(pod)
+            if reason:
+                return False, reason
+        return False, "timeout"
+    except client.exceptions.ApiException:
+        pass
+    finally:
+        w.stop()
     
-    while time.time() - start_time < timeout:
+    # The watch failed; fall back to polling for the rest of the timeout
+    while time.time() < deadline:
         try:
             pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
-            
-            if pod.status.phase == "Running":
-                # Check if all containers are ready
-                if pod.status.container_statuses:
-                    all_ready = all(
-                        container.ready
-                        for container in pod.status.container_statuses
-                    )
-                    if all_ready:
-                        return True
-                        
+            if is_pod_ready(pod):
+                return True, ""
+            reason = pod_terminal_reason(pod)
+            if reason:
+                return False, reason
         except client.exceptions.ApiException:
             pass
-            
         time.sleep(1)
     
+    return False, "timeout"
+
+
+def assert_watcher_alive(
+    v1: client.CoreV1Api,
+    deployment: Dict[str, Any],
+    max_age: float = 60
+) -> None:
+    """
+    Check that a watcher deployment is still ready.
+    
+    Readiness observed within the last `max_age` seconds (recorded in the
+    deployment's "ready_at") is trusted without asking the API server;
+    otherwise the pod is read once and the timestamp refreshed.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        deployment: Watcher deployment returned by the fixtures
+        max_age: Seconds for which a previous readiness check is trusted
+        
+    Raises:
+        AssertionError: If the watcher pod is no longer ready
+    """
+    if time.monotonic() - deployment.get("ready_at", float("-inf")) < max_age:
+        return
+    
+    pod = v1.read_namespaced_pod(
+        name=deployment["pod_name"],
+        namespace=deployment["namespace"]
+    )
+    reason = pod_terminal_reason(pod)
+    assert is_pod_ready(pod), (
+        f"Watcher pod {deployment['pod_name']} is not ready: {reason or pod.status.phase}"
+    )
+    deployment["ready_at"] = time.monotonic()
+
+
+def wait_for_condition(
+    custom_api: client.CustomObjectsApi,
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    namespace: str,
+    cond_type: str = "Ready",
+    timeout: int = 60
+) -> bool:
+    """
+    Wait for a custom resource to report a condition as True.
+    
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        group: API group of the resource
+        version: API version of the resource
+        plural: Plural resource name
+        name: Name of the resource
+        namespace: Namespace of the resource
+        cond_type: Condition type to wait for
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        True if the condition became True, False otherwise
+    """
+    w = watch.Watch()
+    try:
+        for event in w.stream(
+            custom_api.list_namespaced_custom_object,
+            group=group,
+            version=version,
+            namespace=namespace,
+            plural=plural,
+            field_selector=f"metadata.name={name}",
+            timeout_seconds=timeout
+        ):
+            status = event["object"].get("status") or {}
+            for condition in status.get("conditions") or []:
+                if condition.get("type") == cond_type and condition.get("status") == "True":
+                    return True
+    except client.exceptions.ApiException:
+        pass
+    finally:
+        w.stop()
+    
     return False
 
 
+def wait_cert_ready(
+    custom_api: client.CustomObjectsApi,
+    name: str,
+    namespace: str,
+    timeout: int = 60
+) -> bool:
+    """
+    Wait for a cert-manager Certificate to be issued.
+    
+    Args:
+        custom_api: Kubernetes CustomObjectsApi client
+        name: Name of the Certificate
+        namespace: Namespace of the Certificate
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        True if the Certificate became Ready, False otherwise
+    """
+    return wait_for_condition(
+        custom_api,
+        "cert-manager.io",
+        "v1",
+        "certificates",
+        name,
+        namespace,
+        timeout=timeout
+    )
+
+
+class PodShell:
+    """
+    Long-running shell in a pod that runs several commands over one exec.
+    
+    Each command's output is delimited by a sentinel line carrying its exit
+    status, so repeated checks don't pay an exec upgrade apiece.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        container: Optional container name
+    """
+    
+    _SENTINEL = "__k8s_watcher_end__"
+    
+    def __init__(
+        self,
+        v1: client.CoreV1Api,
+        pod_name: str,
+        namespace: str,
+        container: Optional[str] = None
+    ):
+        self.v1 = v1
+        self.pod_name = pod_name
+        self.namespace = namespace
+        self.container = container
+        self._resp = None
+    
+    def __enter__(self) -> "PodShell":
+        kwargs = {
+            'command': ['/bin/sh'],
+            'stderr': False,
+            'stdin': True,
+            'stdout': True,
+            'tty': False,
+            '_preload_content': False
+        }
+        if self.container:
+            kwargs['container'] = self.container
+        
+        self._resp = stream(
+            self.v1.connect_get_namespaced_pod_exec,
+            self.pod_name,
+            self.namespace,
+            **kwargs
+        )
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self._resp.close()
+    
+    def run(self, command: str, timeout: float = 10) -> Tuple[int, str]:
+        """
+        Run a shell command and wait for it to finish.
+        
+        Args:
+            command: Shell command line
+            timeout: Maximum time to wait for the command in seconds
+            
+        Returns:
+            Tuple of (exit status, stdout)
+            
+        Raises:
+            TimeoutError: If the command did not finish in time
+        """
+        # The leading newline ends any unterminated output line, so the
+        # sentinel always starts a line of its own
+        marker = f"\n{self._SENTINEL} "
+        self._resp.write_stdin(f"{command}\nprintf '\\n{self._SENTINEL} %d\\n' $?\n")
+        
+        deadline = time.time() + timeout
+        output = ""
+        while marker not in output or not output.endswith("\n"):
+            remaining = deadline - time.time()
+            if remaining <= 0 or not self._resp.is_open():
+                raise TimeoutError(f"Command did not finish in pod {self.pod_name}: {command}")
+            output += self._resp.read_stdout(timeout=min(remaining, 1))
+        
+        stdout, _, status = output.rpartition(marker)
+        return int(status), stdout
+
+
 def wait_for_file_in_pod(
     v1: client.CoreV1Api,
     pod_name: str,
@@ -71,19 +499,264 @@ def wait_for_file_in_pod(
     Returns:
         True if file exists, False otherwise
     """
-    start_time = time.time()
+    deadline = time.time() + timeout
+    
+    while time.time() < deadline:
+        remaining = deadline - time.time()
+        if _poll_file_in_pod(v1, pod_name, namespace, [file_path], remaining, container):
+            return True
+        # The exec could not be started (e.g. container restarting); retry
+        time.sleep(1)
+    
+    log.warning("Timed out waiting for file %s in pod %s", file_path, pod_name)
+    # Only the lines logged while waiting are relevant to the failure
+    logs = get_pod_logs(
+        v1,
+        pod_name,
+        namespace,
+        tail_lines=50,
+        container=container,
+        since_seconds=timeout + 5
+    )
+    log.warning("Pod logs:\n%s", logs)
+    return False
+
+
+def wait_for_files_in_pod(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    file_paths: List[str],
+    timeout: int = 30,
+    container: Optional[str] = None
+) -> bool:
+    """
+    Wait for several files in a pod to all be non-empty.
+    
+    The watcher writes the keys of a resource one at a time, in no
+    particular order and without an atomic rename, so one file existing
+    says nothing about the others. All of them are checked over a single
+    exec session.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        file_paths: Paths of the files inside the pod
+        timeout: Maximum time to wait in seconds
+        container: Optional container name
+        
+    Returns:
+        True if every file has content, False otherwise
+    """
+    deadline = time.time() + timeout
     
-    while time.time() - start_time < timeout:
-        if file_exists_in_pod(v1, pod_name, namespace, file_path, container):
+    while time.time() < deadline:
+        remaining = deadline - time.time()
+        if _poll_file_in_pod(v1, pod_name, namespace, file_paths, remaining, container, test="-s"):
             return True
+        # The exec could not be started (e.g. container restarting); retry
         time.sleep(1)
     
-    print(f"Timed out waiting for file {file_path} in pod {pod_name}")
-    logs = get_pod_logs(v1, pod_name, namespace, container=container)
-    print(f"Pod logs:\n{logs}")
+    log.warning("Timed out waiting for files %s in pod %s", file_paths, pod_name)
     return False
 
 
+def wait_for_file_content_in_pod(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    file_path: str,
+    expected: str,
+    timeout: int = 15,
+    interval: float = 0.2,
+    debounce: float = 0.4
+) -> Optional[str]:
+    """
+    Wait for a file in a pod to settle on the expected content.
+    
+    The content only counts once two reads at least `debounce` seconds
+    apart both match, so a watcher still processing a burst of events
+    isn't caught mid-way. The file is re-read over one PodShell session
+    rather than one exec per read.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        file_path: Path to the file inside the pod
+        expected: Content to wait for
+        timeout: Maximum time to wait in seconds
+        interval: Time between reads in seconds
+        debounce: Time the content must stay unchanged in seconds
+        
+    Returns:
+        The last content read (equal to expected on success), or None if the
+        file could not be read
+    """
+    deadline = time.time() + timeout
+    content = None
+    matched_at = None
+    command = f"cat {shlex.quote(file_path)}"
+    
+    try:
+        with PodShell(v1, pod_name, namespace) as shell:
+            while True:
+                status, output = shell.run(command)
+                content = output if status == 0 else None
+                now = time.time()
+                if content != expected:
+                    matched_at = None
+                elif matched_at is None:
+                    matched_at = now
+                elif now - matched_at >= debounce:
+                    break
+                if now >= deadline:
+                    break
+                time.sleep(interval)
+    except Exception as e:
+        log.warning("Reading %s in pod %s failed: %s", file_path, pod_name, e)
+    
+    return content
+
+
+def wait_and_read_file_in_pod(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    file_path: str,
+    timeout: int = 30,
+    container: Optional[str] = None
+) -> Optional[str]:
+    """
+    Wait for a file in a pod and read it in the same exec.
+    
+    The container's shell polls every 0.2s until the file is non-empty and
+    then cats it, so a happy-path check costs one exec instead of a wait
+    followed by a read. Waiting for content rather than existence avoids
+    reading a file the watcher has created but not yet written.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        file_path: Path to the file inside the pod
+        timeout: Maximum time to wait in seconds
+        container: Optional container name
+        
+    Returns:
+        File contents, or None if the file was not written in time
+    """
+    polls = max(1, int(timeout * 5))
+    script = (
+        f'i=0; while [ $i -lt {polls} ]; do '
+        '[ -s "$1" ] && exec cat "$1"; '
+        'sleep 0.2; i=$((i+1)); done; exit 1'
+    )
+    kwargs = {
+        'command': ['/bin/sh', '-c', script, 'sh', file_path],
+        'stderr': False,
+        'stdin': False,
+        'stdout': True,
+        'tty': False,
+        '_preload_content': False
+    }
+    if container:
+        kwargs['container'] = container
+    
+    try:
+        resp = stream(
+            v1.connect_get_namespaced_pod_exec,
+            pod_name,
+            namespace,
+            **kwargs
+        )
+    except Exception:
+        return None
+    
+    try:
+        resp.run_forever(timeout=timeout + 5)
+        content = resp.read_stdout(timeout=0)
+        if resp.returncode != 0:
+            log.warning("Timed out waiting for file %s in pod %s", file_path, pod_name)
+            return None
+        return content
+    except Exception:
+        return None
+    finally:
+        resp.close()
+
+
+def _poll_file_in_pod(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    file_paths: List[str],
+    timeout: float,
+    container: Optional[str] = None,
+    test: str = "-f"
+) -> bool:
+    """
+    Poll for files from inside the pod over a single exec session.
+    
+    The check loops in the container's shell every 0.2s, so only one exec
+    upgrade is paid however long the wait is.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        file_paths: Paths of the files inside the pod
+        timeout: Maximum time to wait in seconds
+        container: Optional container name
+        test: Shell test every file must pass ("-f" exists, "-s" non-empty)
+        
+    Returns:
+        True if every file passed the test, False on timeout or exec failure
+    """
+    polls = max(1, int(timeout * 5))
+    script = (
+        f'i=0; while [ $i -lt {polls} ]; do '
+        f'ready=1; for f; do [ {test} "$f" ] || ready=; done; '
+        '[ -n "$ready" ] && { echo exists; exit 0; }; '
+        'sleep 0.2; i=$((i+1)); done; exit 1'
+    )
+    kwargs = {
+        'command': ['/bin/sh', '-c', script, 'sh'] + file_paths,
+        'stderr': True,
+        'stdin': False,
+        'stdout': True,
+        'tty': False,
+        '_preload_content': False
+    }
+    if container:
+        kwargs['container'] = container
+    
+    try:
+        resp = stream(
+            v1.connect_get_namespaced_pod_exec,
+            pod_name,
+            namespace,
+            **kwargs
+        )
+    except Exception:
+        return False
+    
+    deadline = time.time() + timeout + 5
+    output = ""
+    try:
+        while resp.is_open() and time.time() < deadline:
+            output += resp.read_stdout(timeout=1)
+            if 'exists' in output:
+                return True
+        output += resp.read_stdout(timeout=0)
+        return 'exists' in output
+    except Exception:
+        return False
+    finally:
+        resp.close()
+
+
 def file_exists_in_pod(
     v1: client.CoreV1Api,
     pod_name: str,
@@ -127,6 +800,59 @@ def file_exists_in_pod(
         return False
 
 
+def stat_and_read(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    file_path: str,
+    container: Optional[str] = None
+) -> Tuple[bool, int, Optional[str]]:
+    """
+    Check for a file and read it in a single exec.
+    
+    Unlike read_file_from_pod, a missing file is reported as such rather than
+    as cat's error message.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        file_path: Path to the file inside the pod
+        container: Optional container name
+        
+    Returns:
+        Tuple of (exists, size in bytes, contents); contents is None if the
+        file doesn't exist
+    """
+    kwargs = {
+        'command': [
+            '/bin/sh', '-c', 'stat -c %s "$1" 2>/dev/null || exit 1; cat "$1"',
+            'sh', file_path
+        ],
+        'stderr': False,
+        'stdin': False,
+        'stdout': True,
+        'tty': False
+    }
+    if container:
+        kwargs['container'] = container
+    
+    try:
+        resp = stream(
+            v1.connect_get_namespaced_pod_exec,
+            pod_name,
+            namespace,
+            **kwargs
+        )
+    except Exception:
+        return False, 0, None
+    
+    size, newline, content = resp.partition("\n")
+    if not newline or not size.isdigit():
+        return False, 0, None
+    return True, int(size), content
+
+
 def read_file_from_pod(
     v1: client.CoreV1Api,
     pod_name: str,
@@ -162,6 +888,87 @@ def read_file_from_pod(
         return None
 
 
+def read_files_from_pod(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    file_paths: List[str],
+    container: Optional[str] = None,
+    timeout: int = 30
+) -> Dict[str, Optional[str]]:
+    """
+    Read several files from a pod in a single exec.
+    
+    The files are streamed as one tar archive (as `kubectl cp` does) and
+    unpacked in memory, so the exec upgrade is paid once for all of them.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        file_paths: Absolute paths of the files inside the pod
+        container: Optional container name
+        timeout: Maximum time to wait for the transfer in seconds
+        
+    Returns:
+        Mapping of each path to its contents, or None if it doesn't exist
+    """
+    contents: Dict[str, Optional[str]] = {path: None for path in file_paths}
+    
+    # tar reports missing files on stderr, which is left off so it cannot
+    # corrupt the archive on stdout
+    kwargs = {
+        'command': ['tar', 'cf', '-', '-C', '/'] + [path.lstrip('/') for path in file_paths],
+        'stderr': False,
+        'stdin': False,
+        'stdout': True,
+        'tty': False,
+        'binary': True,
+        '_preload_content': False
+    }
+    if container:
+        kwargs['container'] = container
+    
+    try:
+        resp = stream(
+            v1.connect_get_namespaced_pod_exec,
+            pod_name,
+            namespace,
+            **kwargs
+        )
+        try:
+            resp.run_forever(timeout=timeout)
+            archive = resp.read_all()
+        finally:
+            resp.close()
+        
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            for member in tar.getmembers():
+                f = tar.extractfile(member)
+                if f is not None:
+                    contents["/" + member.name.lstrip("/")] = f.read().decode('utf-8')
+    except Exception:
+        pass
+    
+    return contents
+
+
+def unique_name(prefix: str) -> str:
+    """
+    Make a resource name unique to the calling test.
+    
+    Tests sharing a session-scoped watcher share its namespace too, so
+    their resources must not collide or be mistaken for each other.
+    
+    Args:
+        prefix: Readable start of the name
+        
+    Returns:
+        The prefix with a random suffix
+    """
+    return f"{prefix}-{uuid.uuid4().hex[:6]}"
+
+
 def create_configmap(
     v1: client.CoreV1Api,
     name: str,
@@ -199,11 +1006,44 @@ def create_configmap(
     )
 
 
+def create_configmaps_bulk(
+    v1: client.CoreV1Api,
+    namespace: str,
+    configmaps: List[client.V1ConfigMap],
+    executor: Executor
+) -> None:
+    """
+    Create several ConfigMaps concurrently.
+    
+    The API server has no batch create, so the calls are issued in parallel
+    over the client's connection pool instead of one after another. The
+    responses are not deserialized into models, since callers only need
+    the ConfigMaps to exist.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        namespace: Namespace
+        configmaps: ConfigMaps to create
+        executor: Executor to issue the calls on
+    """
+    def create(configmap: client.V1ConfigMap) -> None:
+        resp = v1.create_namespaced_config_map(
+            namespace=namespace,
+            body=configmap,
+            _preload_content=False
+        )
+        # Reading the body to the end returns the connection to the pool
+        resp.read()
+    
+    for future in [executor.submit(create, configmap) for configmap in configmaps]:
+        future.result()
+
+
 def create_secret(
     v1: client.CoreV1Api,
     name: str,
     namespace: str,
-    data: Dict[str, bytes],
+    data: Dict[str, Union[bytes, str]],
     labels: Optional[Dict[str, str]] = None,
     annotations: Optional[Dict[str, str]] = None,
     secret_type: str = "Opaque"
@@ -215,7 +1055,7 @@ def create_secret(
         v1: Kubernetes CoreV1Api client
         name: Secret name
         namespace: Namespace
-        data: Secret data (as bytes)
+        data: Secret data, as raw bytes or as already base64-encoded strings
         labels: Optional labels
         annotations: Optional annotations
         secret_type: Secret type (default: Opaque)
@@ -223,10 +1063,11 @@ def create_secret(
     Returns:
         Created Secret object
     """
-    import base64
-    
-    # Encode data to base64
-    encoded_data = {k: base64.b64encode(v).decode('utf-8') for k, v in data.items()}
+    # Encode raw values to base64; strings are passed through as encoded
+    encoded_data = {
+        k: base64.b64encode(v).decode('utf-8') if isinstance(v, bytes) else v
+        for k, v in data.items()
+    }
     
     secret = client.V1Secret(
         metadata=client.V1ObjectMeta(
@@ -244,18 +1085,42 @@ def create_secret(
     )
 
 
-def delete_all_configmaps(v1: client.CoreV1Api, namespace: str):
-    """Delete all ConfigMaps in a namespace."""
+def _background_delete_options() -> client.V1DeleteOptions:
+    """Delete options that neither wait on dependents nor grace periods."""
+    return client.V1DeleteOptions(
+        propagation_policy="Background",
+        grace_period_seconds=0
+    )
+
+
+def delete_all_configmaps(
+    v1: client.CoreV1Api,
+    namespace: str,
+    label_selector: Optional[str] = None
+):
+    """Delete all ConfigMaps in a namespace, optionally only those matching a label selector."""
     try:
-        v1.delete_collection_namespaced_config_map(namespace=namespace)
+        v1.delete_collection_namespaced_config_map(
+            namespace=namespace,
+            body=_background_delete_options(),
+            label_selector=label_selector
+        )
     except client.exceptions.ApiException:
         pass
 
 
-def delete_all_secrets(v1: client.CoreV1Api, namespace: str):
-    """Delete all Secrets in a namespace."""
+def delete_all_secrets(
+    v1: client.CoreV1Api,
+    namespace: str,
+    label_selector: Optional[str] = None
+):
+    """Delete all Secrets in a namespace, optionally only those matching a label selector."""
     try:
-        v1.delete_collection_namespaced_secret(namespace=namespace)
+        v1.delete_collection_namespaced_secret(
+            namespace=namespace,
+            body=_background_delete_options(),
+            label_selector=label_selector
+        )
     except client.exceptions.ApiException:
         pass
 
@@ -287,8 +1152,9 @@ def get_pod_logs(
     v1: client.CoreV1Api,
     pod_name: str,
     namespace: str,
-    tail_lines: int = 100,
-    container: Optional[str] = None
+    tail_lines: Optional[int] = 100,
+    container: Optional[str] = None,
+    since_seconds: Optional[int] = None
 ) -> str:
     """
     Get logs from a pod.
@@ -297,8 +1163,9 @@ def get_pod_logs(
         v1: Kubernetes CoreV1Api client
         pod_name: Name of the pod
         namespace: Namespace of the pod
-        tail_lines: Number of lines to tail
+        tail_lines: Number of lines to tail, or None for the whole log
         container: Optional container name
+        since_seconds: Only return lines from the last this many seconds
         
     Returns:
         Pod logs as string
@@ -311,7 +1178,272 @@ def get_pod_logs(
         }
         if container:
             kwargs['container'] = container
+        if since_seconds:
+            kwargs['since_seconds'] = since_seconds
             
         return v1.read_namespaced_pod_log(**kwargs)
     except client.exceptions.ApiException:
         return ""
+
+
+@dataclass(frozen=True)
+class LogCursor:
+    """
+    A position in a pod's log, used to read only the lines logged after it.
+    
+    Attributes:
+        timestamp: Kubelet timestamp of the last line, or None if the log was empty
+        taken_at: Local time the cursor was taken, used to bound since_seconds
+    """
+    timestamp: Optional[str]
+    taken_at: float
+
+
+def log_cursor(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    container: Optional[str] = None
+) -> LogCursor:
+    """
+    Mark the current end of a pod's log, transferring only its last line.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        container: Optional container name
+        
+    Returns:
+        Cursor to pass as ``after`` to tail_logs_until and its wrappers
+    """
+    taken_at = time.time()
+    kwargs = {
+        'name': pod_name,
+        'namespace': namespace,
+        'tail_lines': 1,
+        'timestamps': True
+    }
+    if container:
+        kwargs['container'] = container
+    try:
+        last_line = v1.read_namespaced_pod_log(**kwargs).strip()
+    except client.exceptions.ApiException:
+        last_line = ""
+    return LogCursor(timestamp=last_line.split(" ", 1)[0] or None, taken_at=taken_at)
+
+
+def _log_timestamp_key(timestamp: str) -> Tuple[str, str]:
+    # RFC3339Nano drops trailing zeros from the fraction, so pad it before comparing
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return seconds, fraction.ljust(9, "0")
+
+
+def tail_logs_until(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    predicate: Callable[[str], bool],
+    timeout: int = 30,
+    container: Optional[str] = None,
+    since_seconds: Optional[int] = None,
+    after: Optional[LogCursor] = None
+) -> bool:
+    """
+    Follow a pod's log until the text received so far satisfies a predicate.
+    
+    The log is followed over one streaming request, so new lines arrive as
+    soon as the kubelet forwards them and nothing is transferred twice. With
+    a cursor, the request starts a moment before it was taken and lines up
+    to it are dropped, so a long-lived pod's earlier log is not re-read.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        predicate: Called with all complete log lines received so far
+        timeout: Maximum time to wait in seconds
+        container: Optional container name
+        since_seconds: Only follow lines from the last this many seconds
+        after: Only pass lines logged after this cursor to the predicate
+        
+    Returns:
+        True if the predicate was satisfied, False otherwise
+    """
+    deadline = time.time() + timeout
+    after_key = None
+    if after and after.timestamp:
+        after_key = _log_timestamp_key(after.timestamp)
+        # Whole seconds, rounded up with a second of slack for clock skew
+        since_seconds = int(time.time() - after.taken_at) + 2
+    kwargs = {
+        'name': pod_name,
+        'namespace': namespace,
+        'follow': True,
+        '_preload_content': False,
+        # Bounds each read, so a quiet log cannot hold the wait past the deadline
+        '_request_timeout': timeout
+    }
+    if container:
+        kwargs['container'] = container
+    if since_seconds:
+        kwargs['since_seconds'] = since_seconds
+    if after_key:
+        kwargs['timestamps'] = True
+    
+    try:
+        resp = v1.read_namespaced_pod_log(**kwargs)
+    except client.exceptions.ApiException:
+        return False
+    
+    logs = ""
+    partial = ""
+    try:
+        for chunk in resp.stream(decode_content=True):
+            lines, _, partial = (partial + chunk.decode('utf-8', errors='replace')).rpartition("\n")
+            if lines and after_key:
+                lines = "\n".join(
+                    line
+                    for timestamp, _, line in (
+                        stamped.partition(" ") for stamped in lines.split("\n")
+                    )
+                    if _log_timestamp_key(timestamp) > after_key
+                )
+            if lines:
+                logs += lines + "\n"
+                if predicate(logs):
+                    return True
+            if time.time() >= deadline:
+                break
+        # An unterminated last line still carries its timestamp, so only
+        # offer it without a cursor
+        return predicate(logs if after_key else logs + partial)
+    except Exception:
+        return False
+    finally:
+        resp.release_conn()
+
+
+def wait_for_log_line(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    pattern: str,
+    timeout: int = 30,
+    container: Optional[str] = None,
+    after: Optional[LogCursor] = None
+) -> bool:
+    """
+    Wait for a pod to log a line matching a regular expression.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the pod
+        namespace: Namespace of the pod
+        pattern: Regular expression searched for in each line
+        timeout: Maximum time to wait in seconds
+        container: Optional container name
+        after: Only match lines logged after this cursor
+        
+    Returns:
+        True if a matching line was logged, False otherwise
+    """
+    regex = re.compile(pattern)
+    return tail_logs_until(
+        v1,
+        pod_name,
+        namespace,
+        lambda logs: regex.search(logs) is not None,
+        timeout=timeout,
+        container=container,
+        after=after
+    )
+
+
+def wait_for_resource_processed(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    name: str,
+    timeout: int = 30,
+    after: Optional[LogCursor] = None
+) -> bool:
+    """
+    Wait for the watcher to log that it processed a resource.
+    
+    The watcher handles the events of one resource type in the order the
+    API server sent them, so once a matching resource created last has been
+    processed, every resource created before it has been seen too. Negative
+    tests use this as a barrier instead of sleeping.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the watcher pod
+        namespace: Namespace of the pod
+        name: Name of a resource matching the watcher's labels
+        timeout: Maximum time to wait in seconds
+        after: Only count processing logged after this cursor
+        
+    Returns:
+        True if the resource was processed, False otherwise
+    """
+    return wait_for_log_line(
+        v1,
+        pod_name,
+        namespace,
+        rf'msg="Processing resource" .*\bname={re.escape(name)}(\s|$)',
+        timeout=timeout,
+        after=after
+    )
+
+
+def wait_for_resources_notified(
+    v1: client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    names: List[str],
+    after: LogCursor,
+    timeout: int = 30
+) -> bool:
+    """
+    Wait for the watcher to send a successful webhook for each resource.
+    
+    The success line carries no resource name, so it is attributed to the
+    resource whose "Processing resource" line came before it: the watcher
+    handles one resource at a time, processing line first, then its files,
+    then its webhook. Only lines after the cursor are considered, so calls
+    left over from earlier tests on a shared watcher cannot count.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        pod_name: Name of the watcher pod
+        namespace: Namespace of the pod
+        names: Resources expected to be notified
+        after: Cursor taken before the resources were created
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        True if every resource was notified, False otherwise
+    """
+    expected = set(names)
+    
+    def all_notified(logs: str) -> bool:
+        notified = set()
+        current = None
+        for line in logs.splitlines():
+            match = _PROCESSING_RE.search(line)
+            if match:
+                current = match.group(1)
+            elif current and "Request completed successfully" in line:
+                notified.add(current)
+                current = None
+        return expected <= notified
+    
+    return tail_logs_until(
+        v1,
+        pod_name,
+        namespace,
+        all_notified,
+        timeout=timeout,
+        after=after
+    )
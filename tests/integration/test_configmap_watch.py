@@ -1,51 +1,108 @@
 """Integration tests for ConfigMap watching functionality."""
 
-import time
+from operator import attrgetter
 import pytest
 from kubernetes import client
 from helpers import (
+    SyncCase,
     create_configmap,
     wait_for_file_in_pod,
-    read_file_from_pod,
-    file_exists_in_pod
+    wait_and_read_file_in_pod,
+    wait_for_files_in_pod,
+    wait_for_file_content_in_pod,
+    wait_for_resource_processed,
+    wait_for_log_line,
+    read_files_from_pod,
+    stat_and_read
 )
 
 
+# Single-file cases: create the ConfigMap, then expect the file or its absence
+CONFIGMAP_CASES = [
+    SyncCase(
+        name="test-cm",
+        labels={"app": "test"},
+        data={"config.txt": "test content"},
+        path="/tmp/k8s-watcher-data/{namespace}/test-cm/config.txt",
+        content="test content"
+    ),
+    SyncCase(
+        # Folder annotation overrides the default output path
+        name="test-cm-annotation",
+        labels={"app": "test"},
+        annotations={"k8s-watcher-target-dir": "/tmp/k8s-watcher-data/custom-path"},
+        data={"custom.txt": "custom content"},
+        path="/tmp/k8s-watcher-data/custom-path/custom.txt",
+        content="custom content"
+    ),
+    SyncCase(
+        name="test-cm-ignored",
+        labels={"app": "other"},  # Different label value
+        data={"ignored.txt": "should not be synced"},
+        path="/tmp/k8s-watcher-data/{namespace}/test-cm-ignored/ignored.txt",
+        should_sync=False
+    )
+]
+
+
 @pytest.mark.configmap
-def test_configmap_basic_sync(
+@pytest.mark.parametrize("case", CONFIGMAP_CASES, ids=attrgetter("name"))
+def test_configmap_sync(
+    case: SyncCase,
     watcher_deployment: dict,
     k8s_client: client.CoreV1Api,
     test_namespace: str
 ):
-    """Test that ConfigMap data is synced to filesystem."""
+    """Test that ConfigMap data is synced to the filesystem only if its labels match."""
     
-    # Create ConfigMap with matching labels
-    cm = create_configmap(
+    create_configmap(
         k8s_client,
-        name="test-cm",
+        name=case.name,
         namespace=test_namespace,
-        labels={"app": "test"},
-        data={"config.txt": "test content"}
+        labels=case.labels,
+        annotations=case.annotations,
+        data=case.data
     )
     
-    # Wait for file to appear in watcher pod
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-cm/config.txt"
-    assert wait_for_file_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path,
-        timeout=30
-    ), f"File {file_path} was not created in time"
+    file_path = case.path.format(namespace=test_namespace)
     
-    # Verify file content
-    content = read_file_from_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path
-    )
-    assert content == "test content", f"Expected 'test content', got '{content}'"
+    if case.should_sync:
+        # Wait for the file to have content in the watcher pod, then read it
+        # in the same exec; the watcher's write is not atomic, so a file that
+        # merely exists may still be empty
+        content = wait_and_read_file_in_pod(
+            k8s_client,
+            watcher_deployment["pod_name"],
+            test_namespace,
+            file_path,
+            timeout=30
+        )
+        assert content == case.content, f"Expected '{case.content}', got '{content}'"
+    else:
+        # Once a matching ConfigMap created after it has been processed, the
+        # watcher has already passed over this one
+        barrier = f"{case.name}-barrier"
+        create_configmap(
+            k8s_client,
+            name=barrier,
+            namespace=test_namespace,
+            labels={"app": "test"},
+            data={"barrier.txt": "barrier"}
+        )
+        assert wait_for_resource_processed(
+            k8s_client,
+            watcher_deployment["pod_name"],
+            test_namespace,
+            barrier
+        ), f"Watcher did not process {barrier}"
+        
+        exists, _, content = stat_and_read(
+            k8s_client,
+            watcher_deployment["pod_name"],
+            test_namespace,
+            file_path
+        )
+        assert not exists, f"File {file_path} should not have been created, got '{content}'"
 
 
 @pytest.mark.configmap
@@ -84,15 +141,13 @@ def test_configmap_update(
         body=cm
     )
     
-    # Wait for update to propagate
-    time.sleep(5)
-    
-    # Verify updated content
-    content = read_file_from_pod(
+    # Wait for the updated content to be written
+    content = wait_for_file_content_in_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path
+        file_path,
+        "updated content"
     )
     assert content == "updated content", f"Expected 'updated content', got '{content}'"
 
@@ -121,99 +176,29 @@ def test_configmap_multiple_keys(
     # Verify all files are created
     base_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-cm-multi"
     
-    for filename, expected_content in [
-        ("file1.txt", "content1"),
-        ("file2.txt", "content2"),
-        ("file3.txt", "content3")
-    ]:
-        file_path = f"{base_path}/{filename}"
-        
-        assert wait_for_file_in_pod(
-            k8s_client,
-            watcher_deployment["pod_name"],
-            test_namespace,
-            file_path,
-            timeout=30
-        ), f"File {file_path} was not created"
-        
-        content = read_file_from_pod(
-            k8s_client,
-            watcher_deployment["pod_name"],
-            test_namespace,
-            file_path
-        )
-        assert content == expected_content
-
-
-@pytest.mark.configmap
-def test_configmap_annotation_override(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
-    """Test that folder annotation overrides default output path."""
-    
-    # Create ConfigMap with folder annotation
-    cm = create_configmap(
-        k8s_client,
-        name="test-cm-annotation",
-        namespace=test_namespace,
-        labels={"app": "test"},
-        annotations={"k8s-watcher-target-dir": "/tmp/k8s-watcher-data/custom-path"},
-        data={"custom.txt": "custom content"}
-    )
-    
-    # File should be at the custom path
-    file_path = "/tmp/k8s-watcher-data/custom-path/custom.txt"
+    expected = {
+        f"{base_path}/file1.txt": "content1",
+        f"{base_path}/file2.txt": "content2",
+        f"{base_path}/file3.txt": "content3"
+    }
     
-    assert wait_for_file_in_pod(
+    # Each key is written separately, so wait for all of them to have
+    # content before reading them back in one exec
+    assert wait_for_files_in_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path,
+        list(expected),
         timeout=30
-    ), f"File {file_path} was not created at custom path"
+    ), f"Files {list(expected)} were not all written"
     
-    content = read_file_from_pod(
+    contents = read_files_from_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path
+        list(expected)
     )
-    assert content == "custom content"
-
-
-@pytest.mark.configmap
-def test_configmap_ignored_without_labels(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
-    """Test that ConfigMaps without matching labels are ignored."""
-    
-    # Create ConfigMap without matching labels
-    cm = create_configmap(
-        k8s_client,
-        name="test-cm-ignored",
-        namespace=test_namespace,
-        labels={"app": "other"},  # Different label value
-        data={"ignored.txt": "should not be synced"}
-    )
-    
-    # Wait a bit to see if file appears (it shouldn't)
-    time.sleep(5)
-    
-    # Verify file was NOT created
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-cm-ignored/ignored.txt"
-    
-    exists = file_exists_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path
-    )
-    
-    assert not exists, f"File {file_path} should not have been created"
+    assert contents == expected
 
 
 @pytest.mark.configmap
@@ -235,14 +220,14 @@ def test_configmap_deletion(
     
     file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-cm-delete/delete-test.txt"
     
-    # Wait for file to be created
-    assert wait_for_file_in_pod(
+    # Wait for file to be written
+    assert wait_and_read_file_in_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
         file_path,
         timeout=30
-    )
+    ) == "test content"
     
     # Delete ConfigMap
     k8s_client.delete_namespaced_config_map(
@@ -252,10 +237,31 @@ def test_configmap_deletion(
     
     # Note: In the current implementation, files are not deleted when ConfigMaps are deleted
     # This test documents the current behavior - files persist after deletion
-    time.sleep(5)
+    assert wait_for_log_line(
+        k8s_client,
+        watcher_deployment["pod_name"],
+        test_namespace,
+        r'msg="Processing resource" action=Deleted .*\bname=test-cm-delete\b'
+    ), "Watcher did not process the deletion of test-cm-delete"
+    
+    # The line above is logged before the event is handled; once a ConfigMap
+    # created after the deletion has been processed, handling has finished
+    create_configmap(
+        k8s_client,
+        name="test-cm-delete-barrier",
+        namespace=test_namespace,
+        labels={"app": "test"},
+        data={"barrier.txt": "barrier"}
+    )
+    assert wait_for_resource_processed(
+        k8s_client,
+        watcher_deployment["pod_name"],
+        test_namespace,
+        "test-cm-delete-barrier"
+    ), "Watcher did not process test-cm-delete-barrier"
     
     # File should still exist (current behavior)
-    exists = file_exists_in_pod(
+    exists, _, content = stat_and_read(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
@@ -263,3 +269,4 @@ def test_configmap_deletion(
     )
     
     assert exists, "File persists after ConfigMap deletion (current behavior)"
+    assert content == "test content"
@@ -1,16 +1,66 @@
 """Integration test for Grafana sidecar example."""
 
-import time
+import copy
 import pytest
 import yaml
 import os
-from kubernetes import client
-from helpers import wait_for_pod_ready, get_pod_logs, wait_for_file_in_pod
+from kubernetes import client, utils
+from kubernetes.stream import stream
+from helpers import wait_for_pod_by_label, wait_for_pod_ready, get_pod_logs, wait_for_file_in_pod
+
+# The example manifests, parsed once with the libyaml loader if available.
+# The file is read as bytes so libyaml decodes it itself.
+_MANIFEST_PATH = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "examples", "grafana-sidecar", "manifests.yaml"
+))
+with open(_MANIFEST_PATH, 'rb') as _f:
+    _MANIFESTS = [
+        m for m in yaml.load_all(_f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        if m is not None
+    ]
+
+
+def _patch_watcher_config(manifest: dict, namespace: str, image: str) -> None:
+    """Point the watcher config at the test namespace."""
+    if manifest["metadata"]["name"] == "watcher-config":
+        manifest["data"]["config.yaml"] = manifest["data"]["config.yaml"].replace(
+            "namespace: default",
+            f"namespace: {namespace}"
+        )
+
+
+def _patch_subjects(manifest: dict, namespace: str, image: str) -> None:
+    """Bind the role to subjects in the test namespace."""
+    for subject in manifest.get("subjects", []):
+        subject["namespace"] = namespace
+
+
+def _patch_deployment(manifest: dict, namespace: str, image: str) -> None:
+    """Use the locally built watcher image and a short grace period."""
+    pod_spec = manifest["spec"]["template"]["spec"]
+    for container in pod_spec["containers"]:
+        if container["name"] == "k8s-watcher":
+            container["image"] = image
+            container["imagePullPolicy"] = "Never"
+    # The namespace deletion does not shorten pod grace periods, so keep
+    # Grafana from holding up teardown for the default 30s
+    pod_spec["terminationGracePeriodSeconds"] = 1
+
+
+# Per-kind patches applied before the manifests are created
+_PATCHERS = {
+    "ConfigMap": _patch_watcher_config,
+    "RoleBinding": _patch_subjects,
+    "Deployment": _patch_deployment
+}
+
 
 @pytest.mark.example
 def test_grafana_sidecar_example(
     kind_cluster: str,
     docker_image: str,
+    images_loaded: list,
     k8s_client: client.CoreV1Api,
     test_namespace: str
 ):
@@ -18,14 +68,8 @@ def test_grafana_sidecar_example(
     Test the Grafana sidecar example by deploying the manifests
     and verifying the dashboard file is synced.
     """
-    # Read the example manifests
-    manifest_path = os.path.join(
-        os.path.dirname(__file__), 
-        "../../examples/grafana-sidecar/manifests.yaml"
-    )
-    
-    with open(manifest_path, 'r') as f:
-        manifests = list(yaml.safe_load_all(f))
+    # Copy the example manifests so patching them doesn't leak between runs
+    manifests = copy.deepcopy(_MANIFESTS)
     
     # Apply manifests to the test namespace
     # We need to patch the image to use the locally built one
@@ -33,88 +77,30 @@ def test_grafana_sidecar_example(
     
     print(f"\nDeploying Grafana example to namespace: {test_namespace}")
     
-    apps_v1 = client.AppsV1Api()
-    rbac_v1 = client.RbacAuthorizationV1Api()
-    
     for manifest in manifests:
-        if manifest is None:
-            continue
-            
-        # Update namespace
-        if "metadata" in manifest:
-            manifest["metadata"]["namespace"] = test_namespace
-            
-        # Handle different kinds
-        kind = manifest["kind"]
-        
-        if kind == "ConfigMap":
-            # Patch watcher-config to use the correct namespace in config.yaml
-            if manifest["metadata"]["name"] == "watcher-config":
-                config_content = manifest["data"]["config.yaml"]
-                manifest["data"]["config.yaml"] = config_content.replace(
-                    "namespace: default",
-                    f"namespace: {test_namespace}"
-                )
-            
-            k8s_client.create_namespaced_config_map(
-                namespace=test_namespace,
-                body=manifest
-            )
-        elif kind == "Service":
-            k8s_client.create_namespaced_service(
-                namespace=test_namespace,
-                body=manifest
-            )
-        elif kind == "ServiceAccount":
-            k8s_client.create_namespaced_service_account(
-                namespace=test_namespace,
-                body=manifest
-            )
-        elif kind == "Role":
-            rbac_v1.create_namespaced_role(
-                namespace=test_namespace,
-                body=manifest
-            )
-        elif kind == "RoleBinding":
-            # Update subject namespace
-            for subject in manifest.get("subjects", []):
-                subject["namespace"] = test_namespace
-            rbac_v1.create_namespaced_role_binding(
-                namespace=test_namespace,
-                body=manifest
-            )
-        elif kind == "Deployment":
-            # Patch image
-            for container in manifest["spec"]["template"]["spec"]["containers"]:
-                if container["name"] == "k8s-watcher":
-                    container["image"] = docker_image
-                    container["imagePullPolicy"] = "Never"
-            
-            apps_v1.create_namespaced_deployment(
-                namespace=test_namespace,
-                body=manifest
-            )
+        manifest["metadata"]["namespace"] = test_namespace
+        patcher = _PATCHERS.get(manifest["kind"])
+        if patcher:
+            patcher(manifest, test_namespace, docker_image)
+    
+    utils.create_from_yaml(
+        k8s_client.api_client,
+        yaml_objects=manifests,
+        namespace=test_namespace
+    )
 
     # Wait for Grafana pod
     print("Waiting for Grafana pod to be ready...")
     
-    # Give it a moment to be created
-    time.sleep(2)
-    
-    pods = k8s_client.list_namespaced_pod(
-        namespace=test_namespace,
-        label_selector="app=grafana"
-    )
-    
-    if not pods.items:
+    pod_name = wait_for_pod_by_label(k8s_client, test_namespace, "app=grafana")
+    if not pod_name:
         raise RuntimeError("Grafana pod not found")
     
-    pod_name = pods.items[0].metadata.name
-    
-    if not wait_for_pod_ready(k8s_client, pod_name, test_namespace, timeout=120):
+    ready, reason = wait_for_pod_ready(k8s_client, pod_name, test_namespace, timeout=120)
+    if not ready:
         logs = get_pod_logs(k8s_client, pod_name, test_namespace, container="k8s-watcher")
         print(f"Watcher logs:\n{logs}")
-        raise RuntimeError(f"Pod {pod_name} did not become ready")
+        raise RuntimeError(f"Pod {pod_name} did not become ready: {reason}")
         
     print(f"Pod {pod_name} is ready")
     
@@ -130,8 +116,6 @@ def test_grafana_sidecar_example(
     # If uniqueFilenames is true, it usually creates <namespace>/<name>/<key>
     # Let's check the watcher logs to see where it wrote
     
-    time.sleep(5) # Wait for sync
-    
     # Check if file exists. 
     # Based on logs, with uniqueFilenames: true, it creates:
     # /var/lib/grafana/dashboards/<namespace>/<configmap-name>-<key>
@@ -147,7 +131,6 @@ def test_grafana_sidecar_example(
         print(f"Watcher logs:\n{logs}")
         
         # List files in directory
-        from kubernetes.stream import stream
         exec_command = ["ls", "-R", "/var/lib/grafana/dashboards"]
         resp = stream(k8s_client.connect_get_namespaced_pod_exec,
                     pod_name,
@@ -1,16 +1,51 @@
 """Integration tests for label matching functionality."""
 
-import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from kubernetes import client
 from helpers import (
+    SyncCase,
     create_configmap,
     create_secret,
     wait_for_file_in_pod,
-    file_exists_in_pod
+    wait_for_resource_processed,
+    read_files_from_pod
 )
 
 
+# ConfigMaps whose labels don't match the watcher config ("app: test")
+UNMATCHED_CASES = [
+    SyncCase(
+        name="test-wrong-value",
+        labels={"app": "production"},  # "app" key exists but value doesn't match
+        data={"file.txt": "should not sync"},
+        path="/tmp/k8s-watcher-data/{namespace}/test-wrong-value/file.txt",
+        should_sync=False
+    ),
+    SyncCase(
+        name="test-missing-key",
+        labels={"environment": "dev"},  # Different label key
+        data={"file.txt": "should not sync"},
+        path="/tmp/k8s-watcher-data/{namespace}/test-missing-key/file.txt",
+        should_sync=False
+    ),
+    SyncCase(
+        name="test-no-labels",
+        labels={},  # Empty labels
+        data={"file.txt": "should not sync"},
+        path="/tmp/k8s-watcher-data/{namespace}/test-no-labels/file.txt",
+        should_sync=False
+    ),
+    SyncCase(
+        name="test-case-sensitive",
+        labels={"app": "Test"},  # Capital T; matching is case-sensitive
+        data={"file.txt": "should not sync"},
+        path="/tmp/k8s-watcher-data/{namespace}/test-case-sensitive/file.txt",
+        should_sync=False
+    )
+]
+
+
 @pytest.mark.label
 def test_exact_label_match(
     watcher_deployment: dict,
@@ -40,63 +75,55 @@ def test_exact_label_match(
 
 
 @pytest.mark.label
-def test_label_value_mismatch(
+def test_unmatched_labels_ignored(
     watcher_deployment: dict,
     k8s_client: client.CoreV1Api,
-    test_namespace: str
+    test_namespace: str,
+    io_pool: ThreadPoolExecutor
 ):
-    """Test that resources with wrong label value are ignored."""
-    
-    # Create ConfigMap with wrong label value
-    cm = create_configmap(
-        k8s_client,
-        name="test-wrong-value",
+    """Test that resources whose labels don't match the watcher config are ignored."""
+    
+    # Create every ConfigMap up front so they share a single wait
+    creates = [
+        io_pool.submit(
+            create_configmap,
+            k8s_client,
+            name=case.name,
+            namespace=test_namespace,
+            labels=case.labels,
+            data=case.data
+        )
+        for case in UNMATCHED_CASES
+    ]
+    for future in creates:
+        future.result()
+    
+    # Once a matching ConfigMap created after them has been processed, the
+    # watcher has already passed over all of the above
+    create_configmap(
+        k8s_client,
+        name="test-unmatched-barrier",
         namespace=test_namespace,
-        labels={"app": "production"},  # "app" key exists but value doesn't match
-        data={"file.txt": "should not sync"}
+        labels={"app": "test"},
+        data={"file.txt": "barrier"}
     )
-    
-    time.sleep(5)
-    
-    # File should NOT be created
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-wrong-value/file.txt"
-    exists = file_exists_in_pod(
+    assert wait_for_resource_processed(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path
-    )
-    assert not exists, "File should not have been created for mismatched label value"
-
-
-@pytest.mark.label
-def test_label_key_missing(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
-    """Test that resources without the required label key are ignored."""
-    
-    # Create ConfigMap without the required label key
-    cm = create_configmap(
-        k8s_client,
-        name="test-missing-key",
-        namespace=test_namespace,
-        labels={"environment": "dev"},  # Different label key
-        data={"file.txt": "should not sync"}
-    )
-    
-    time.sleep(5)
+        "test-unmatched-barrier"
+    ), "Watcher did not process the barrier ConfigMap"
     
-    # File should NOT be created
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-missing-key/file.txt"
-    exists = file_exists_in_pod(
+    # Files should NOT be created; check them all in one exec
+    paths = {case.path.format(namespace=test_namespace): case.name for case in UNMATCHED_CASES}
+    contents = read_files_from_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path
+        list(paths)
     )
-    assert not exists, "File should not have been created for missing label key"
+    synced = [paths[path] for path, content in contents.items() if content is not None]
+    assert not synced, f"Files should not have been created for {synced}"
 
 
 @pytest.mark.label
@@ -135,104 +162,48 @@ def test_multiple_labels_on_resource(
 def test_both_configmap_and_secret(
     watcher_deployment: dict,
     k8s_client: client.CoreV1Api,
-    test_namespace: str
+    test_namespace: str,
+    io_pool: ThreadPoolExecutor
 ):
     """Test that both ConfigMaps and Secrets are watched when type is 'both'."""
     
-    # Create ConfigMap
-    cm = create_configmap(
-        k8s_client,
-        name="test-both-cm",
-        namespace=test_namespace,
-        labels={"app": "test"},
-        data={"config.txt": "from configmap"}
-    )
-    
-    # Create Secret
-    secret = create_secret(
-        k8s_client,
-        name="test-both-secret",
-        namespace=test_namespace,
-        labels={"app": "test"},
-        data={"secret.txt": b"from secret"}
-    )
-    
-    # Both files should be created
+    # Create the ConfigMap and Secret in parallel
+    creates = [
+        io_pool.submit(
+            create_configmap,
+            k8s_client,
+            name="test-both-cm",
+            namespace=test_namespace,
+            labels={"app": "test"},
+            data={"config.txt": "from configmap"}
+        ),
+        io_pool.submit(
+            create_secret,
+            k8s_client,
+            name="test-both-secret",
+            namespace=test_namespace,
+            labels={"app": "test"},
+            data={"secret.txt": b"from secret"}
+        )
+    ]
+    for future in creates:
+        future.result()
+    
+    # Both files should be created; wait for them concurrently
     cm_file = f"/tmp/k8s-watcher-data/{test_namespace}/test-both-cm/config.txt"
     secret_file = f"/tmp/k8s-watcher-data/{test_namespace}/test-both-secret/secret.txt"
     
-    assert wait_for_file_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        cm_file,
-        timeout=30
-    ), "ConfigMap file was not created"
-    
-    assert wait_for_file_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        secret_file,
-        timeout=30
-    ), "Secret file was not created"
-
-
-@pytest.mark.label
-def test_no_labels_on_resource(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
-    """Test that resources with no labels are ignored."""
-    
-    # Create ConfigMap with no labels
-    cm = create_configmap(
-        k8s_client,
-        name="test-no-labels",
-        namespace=test_namespace,
-        labels={},  # Empty labels
-        data={"file.txt": "should not sync"}
+    cm_synced, secret_synced = (
+        io_pool.submit(
+            wait_for_file_in_pod,
+            k8s_client,
+            watcher_deployment["pod_name"],
+            test_namespace,
+            file_path,
+            timeout=30
+        )
+        for file_path in (cm_file, secret_file)
     )
     
-    time.sleep(5)
-    
-    # File should NOT be created
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-no-labels/file.txt"
-    exists = file_exists_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path
-    )
-    assert not exists, "File should not have been created for resource with no labels"
-
-
-@pytest.mark.label
-def test_case_sensitive_labels(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
-    """Test that label matching is case-sensitive."""
-    
-    # Create ConfigMap with different case
-    cm = create_configmap(
-        k8s_client,
-        name="test-case-sensitive",
-        namespace=test_namespace,
-        labels={"app": "Test"},  # Capital T
-        data={"file.txt": "should not sync"}
-    )
-    
-    time.sleep(5)
-    
-    # File should NOT be created (case mismatch)
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-case-sensitive/file.txt"
-    exists = file_exists_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path
-    )
-    assert not exists, "Label matching should be case-sensitive"
+    assert cm_synced.result(), "ConfigMap file was not created"
+    assert secret_synced.result(), "Secret file was not created"
@@ -1,21 +1,16 @@
 """Integration tests for script execution functionality."""
 
-import time
 import pytest
-from kubernetes import client
-from helpers import (
-    create_configmap,
-    wait_for_file_in_pod,
-    get_pod_logs
+
+
+# Skipped as a module so pytest never sets up the watcher fixtures for them
+pytestmark = pytest.mark.skip(
+    reason="Requires dynamic watcher configuration with scripts - implement with custom fixture"
 )
 
 
 @pytest.mark.script
-def test_script_execution_on_change(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
+def test_script_execution_on_change():
     """Test that script is executed when resource changes."""
     
     # Note: This test requires special watcher configuration with script execution
@@ -25,30 +20,16 @@ def test_script_execution_on_change(
     # 2. Mount a test script into the watcher pod
     # 3. Create a ConfigMap
     # 4. Verify script was executed by checking logs or side effects
-    
-    pytest.skip("Requires watcher configuration with script - implement with custom fixture")
 
 
 @pytest.mark.script
-def test_script_timeout(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
+def test_script_timeout():
     """Test that long-running scripts are terminated after timeout."""
-    
-    pytest.skip("Requires watcher configuration with script timeout - implement with custom fixture")
 
 
 @pytest.mark.script
-def test_script_failure_handling(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
+def test_script_failure_handling():
     """Test that watcher continues when script fails."""
-    
-    pytest.skip("Requires watcher configuration with failing script - implement with custom fixture")
 
 
 # Note: Script tests require dynamic watcher configuration
@@ -1,51 +1,104 @@
 """Integration tests for Secret watching functionality."""
 
-import time
+import base64
+from operator import attrgetter
 import pytest
 from kubernetes import client
+from kubernetes.stream import stream
 from helpers import (
+    SyncCase,
     create_secret,
     wait_for_file_in_pod,
-    read_file_from_pod,
-    file_exists_in_pod
+    wait_and_read_file_in_pod,
+    wait_for_files_in_pod,
+    wait_for_file_content_in_pod,
+    wait_for_resource_processed,
+    read_files_from_pod,
+    stat_and_read
 )
 
 
+# All byte values 0-255, and their base64 encoding for the Secret body
+_BINARY_256 = bytes(range(256))
+_BINARY_256_B64 = base64.b64encode(_BINARY_256).decode('utf-8')
+
+# Single-file cases: create the Secret, then expect the file or its absence
+SECRET_CASES = [
+    SyncCase(
+        name="test-secret",
+        labels={"app": "test"},
+        data={"credentials.txt": b"super secret data"},
+        path="/tmp/k8s-watcher-data/{namespace}/test-secret/credentials.txt",
+        content="super secret data"
+    ),
+    SyncCase(
+        name="test-secret-ignored",
+        labels={"app": "different"},  # Different label value
+        data={"ignored.txt": b"should not be synced"},
+        path="/tmp/k8s-watcher-data/{namespace}/test-secret-ignored/ignored.txt",
+        should_sync=False
+    )
+]
+
+
 @pytest.mark.secret
-def test_secret_basic_sync(
+@pytest.mark.parametrize("case", SECRET_CASES, ids=attrgetter("name"))
+def test_secret_sync(
+    case: SyncCase,
     watcher_deployment: dict,
     k8s_client: client.CoreV1Api,
     test_namespace: str
 ):
-    """Test that Secret data is synced to filesystem."""
+    """Test that Secret data is synced to the filesystem only if its labels match."""
     
-    # Create Secret with matching labels
-    secret = create_secret(
+    create_secret(
         k8s_client,
-        name="test-secret",
+        name=case.name,
         namespace=test_namespace,
-        labels={"app": "test"},
-        data={"credentials.txt": b"super secret data"}
+        labels=case.labels,
+        annotations=case.annotations,
+        data=case.data
     )
     
-    # Wait for file to appear in watcher pod
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-secret/credentials.txt"
-    assert wait_for_file_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path,
-        timeout=30
-    ), f"File {file_path} was not created in time"
+    file_path = case.path.format(namespace=test_namespace)
     
-    # Verify file content
-    content = read_file_from_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path
-    )
-    assert content == "super secret data", f"Expected 'super secret data', got '{content}'"
+    if case.should_sync:
+        # Wait for the file to have content in the watcher pod, then read it
+        # in the same exec; the watcher's write is not atomic, so a file that
+        # merely exists may still be empty
+        content = wait_and_read_file_in_pod(
+            k8s_client,
+            watcher_deployment["pod_name"],
+            test_namespace,
+            file_path,
+            timeout=30
+        )
+        assert content == case.content, f"Expected '{case.content}', got '{content}'"
+    else:
+        # Once a matching Secret created after it has been processed, the
+        # watcher has already passed over this one
+        barrier = f"{case.name}-barrier"
+        create_secret(
+            k8s_client,
+            name=barrier,
+            namespace=test_namespace,
+            labels={"app": "test"},
+            data={"barrier.txt": b"barrier"}
+        )
+        assert wait_for_resource_processed(
+            k8s_client,
+            watcher_deployment["pod_name"],
+            test_namespace,
+            barrier
+        ), f"Watcher did not process {barrier}"
+        
+        exists, _, content = stat_and_read(
+            k8s_client,
+            watcher_deployment["pod_name"],
+            test_namespace,
+            file_path
+        )
+        assert not exists, f"File {file_path} should not have been created, got '{content}'"
 
 
 @pytest.mark.secret
@@ -77,7 +130,6 @@ def test_secret_update(
     )
     
     # Update Secret
-    import base64
     secret.data["password.txt"] = base64.b64encode(b"updated-password").decode('utf-8')
     k8s_client.patch_namespaced_secret(
         name="test-secret-update",
@@ -85,15 +137,13 @@ def test_secret_update(
         body=secret
     )
     
-    # Wait for update to propagate
-    time.sleep(5)
-    
-    # Verify updated content
-    content = read_file_from_pod(
+    # Wait for the updated content to be written
+    content = wait_for_file_content_in_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path
+        file_path,
+        "updated-password"
     )
     assert content == "updated-password", f"Expected 'updated-password', got '{content}'"
 
@@ -107,46 +157,46 @@ def test_secret_binary_data(
     """Test that binary data in Secrets is handled correctly."""
     
     # Create Secret with binary data
-    binary_data = bytes(range(256))  # All byte values 0-255
-    
     secret = create_secret(
         k8s_client,
         name="test-secret-binary",
         namespace=test_namespace,
         labels={"app": "test"},
-        data={"binary.dat": binary_data}
+        data={"binary.dat": _BINARY_256_B64}
     )
     
     file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-secret-binary/binary.dat"
     
-    assert wait_for_file_in_pod(
+    # Wait for content, not just existence; the watcher's write is not atomic
+    assert wait_for_files_in_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path,
+        [file_path],
         timeout=30
     )
     
-    # Read the file as binary and verify it matches
-    # Note: The kubernetes stream API returns text, so we use base64 for binary comparison
-    from kubernetes.stream import stream
-    import base64
-    exec_command = ['/bin/sh', '-c', f'base64 {file_path}']
+    # Read the raw bytes straight off the stdout channel; binary mode keeps
+    # the client from decoding them as UTF-8
     resp = stream(
         k8s_client.connect_get_namespaced_pod_exec,
         watcher_deployment["pod_name"],
         test_namespace,
-        command=exec_command,
+        command=['cat', file_path],
         stderr=False,
         stdin=False,
         stdout=True,
         tty=False,
+        binary=True,
+        _preload_content=False
     )
+    try:
+        resp.run_forever(timeout=30)
+        file_content = resp.read_all()
+    finally:
+        resp.close()
     
-    # Decode base64 to get original binary content
-    file_content = base64.b64decode(resp.strip())
-    
-    assert file_content == binary_data, "Binary data mismatch"
+    assert file_content == _BINARY_256, "Binary data mismatch"
 
 
 @pytest.mark.secret
@@ -173,61 +223,29 @@ def test_secret_multiple_keys(
     # Verify all files are created
     base_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-secret-multi"
     
-    for filename, expected_content in [
-        ("username", "admin"),
-        ("password", "secret123"),
-        ("api-key", "abc-def-ghi")
-    ]:
-        file_path = f"{base_path}/{filename}"
-        
-        assert wait_for_file_in_pod(
-            k8s_client,
-            watcher_deployment["pod_name"],
-            test_namespace,
-            file_path,
-            timeout=30
-        ), f"File {file_path} was not created"
-        
-        content = read_file_from_pod(
-            k8s_client,
-            watcher_deployment["pod_name"],
-            test_namespace,
-            file_path
-        )
-        assert content == expected_content
-
-
-@pytest.mark.secret
-def test_secret_ignored_without_labels(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
-    """Test that Secrets without matching labels are ignored."""
+    expected = {
+        f"{base_path}/username": "admin",
+        f"{base_path}/password": "secret123",
+        f"{base_path}/api-key": "abc-def-ghi"
+    }
     
-    # Create Secret without matching labels
-    secret = create_secret(
+    # Each key is written separately, so wait for all of them to have
+    # content before reading them back in one exec
+    assert wait_for_files_in_pod(
         k8s_client,
-        name="test-secret-ignored",
-        namespace=test_namespace,
-        labels={"app": "different"},  # Different label value
-        data={"ignored.txt": b"should not be synced"}
-    )
-    
-    # Wait a bit to see if file appears (it shouldn't)
-    time.sleep(5)
-    
-    # Verify file was NOT created
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-secret-ignored/ignored.txt"
+        watcher_deployment["pod_name"],
+        test_namespace,
+        list(expected),
+        timeout=30
+    ), f"Files {list(expected)} were not all written"
     
-    exists = file_exists_in_pod(
+    contents = read_files_from_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path
+        list(expected)
     )
-    
-    assert not exists, f"File {file_path} should not have been created"
+    assert contents == expected
 
 
 @pytest.mark.secret
@@ -257,38 +275,21 @@ def test_secret_tls_certificate(
     # Verify both files are created
     base_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-tls-secret"
     
-    # Check certificate
     cert_path = f"{base_path}/tls.crt"
-    assert wait_for_file_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        cert_path,
-        timeout=30
-    )
-    
-    cert_content = read_file_from_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        cert_path
-    )
-    assert "BEGIN CERTIFICATE" in cert_content
-    
-    # Check key
     key_path = f"{base_path}/tls.key"
-    assert wait_for_file_in_pod(
+    assert wait_for_files_in_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        key_path,
+        [cert_path, key_path],
         timeout=30
-    )
+    ), "TLS certificate and key were not both written"
     
-    key_content = read_file_from_pod(
+    contents = read_files_from_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        key_path
+        [cert_path, key_path]
     )
-    assert "BEGIN PRIVATE KEY" in key_content
+    assert "BEGIN CERTIFICATE" in (contents[cert_path] or "")
+    assert "BEGIN PRIVATE KEY" in (contents[key_path] or "")
@@ -0,0 +1,94 @@
+"""Integration tests for the create, sync and notify flow across watcher configurations."""
+
+import pytest
+from kubernetes import client
+from helpers import (
+    create_configmap,
+    get_pod_logs,
+    log_cursor,
+    unique_name,
+    wait_and_read_file_in_pod,
+    wait_for_resources_notified
+)
+
+
+@pytest.mark.parametrize(
+    "deployment_fixture,label_app,cm_name,file_name,expected,notified",
+    [
+        # Default watcher config uses WATCH mode (informer-based)
+        pytest.param(
+            "watcher_deployment", "test", "test-watch-mode", "watch.txt",
+            "watched via informer", False,
+            id="watch-mode", marks=pytest.mark.watch
+        ),
+        pytest.param(
+            "webhook_watcher_deployment", "webhook-test", "test-webhook-cm", "test.txt",
+            "webhook test content", True,
+            id="webhook", marks=pytest.mark.webhook
+        ),
+        pytest.param(
+            "webhook_watcher_deployment_auth", "webhook-auth-test", "test-webhook-auth",
+            "auth-test.txt", "authenticated content", True,
+            id="webhook-basic-auth", marks=pytest.mark.webhook
+        ),
+        pytest.param(
+            "webhook_watcher_deployment_tls", "webhook-tls-test", "test-webhook-tls",
+            "tls-test.txt", "tls encrypted content", True,
+            id="webhook-tls", marks=[pytest.mark.webhook, pytest.mark.tls]
+        )
+    ]
+)
+def test_configmap_synced_and_notified(
+    deployment_fixture: str,
+    label_app: str,
+    cm_name: str,
+    file_name: str,
+    expected: str,
+    notified: bool,
+    k8s_client: client.CoreV1Api,
+    request: pytest.FixtureRequest
+):
+    """Test that a matching ConfigMap is written to disk and, if configured, notified."""
+    
+    deployment = request.getfixturevalue(deployment_fixture)
+    pod_name = deployment["pod_name"]
+    namespace = deployment["namespace"]
+    
+    # Webhook watchers are shared across tests, so only calls logged after
+    # this cursor count, and resource names must be unique to this test
+    cursor = log_cursor(k8s_client, pod_name, namespace) if notified else None
+    cm_name = unique_name(cm_name)
+    
+    create_configmap(
+        k8s_client,
+        name=cm_name,
+        namespace=namespace,
+        labels={"app": label_app},
+        data={file_name: expected}
+    )
+    
+    # Verify file was created with the ConfigMap's content
+    file_path = f"/tmp/k8s-watcher-data/{namespace}/{cm_name}/{file_name}"
+    content = wait_and_read_file_in_pod(
+        k8s_client,
+        pod_name,
+        namespace,
+        file_path,
+        timeout=30
+    )
+    assert content == expected, f"File {file_path} was not created, got '{content}'"
+    
+    if notified:
+        # Verify the webhook was called successfully for this ConfigMap
+        assert wait_for_resources_notified(
+            k8s_client,
+            pod_name,
+            namespace,
+            [cm_name],
+            after=cursor
+        ), f"Webhook call for {cm_name} not found in logs. Logs:\n" + get_pod_logs(
+            k8s_client,
+            pod_name,
+            namespace,
+            tail_lines=50
+        )
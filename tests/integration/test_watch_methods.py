@@ -1,54 +1,22 @@
 """Integration tests for watch method functionality."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 import pytest
 from kubernetes import client
 from helpers import (
+    assert_watcher_alive,
     create_configmap,
+    create_configmaps_bulk,
     wait_for_file_in_pod,
-    read_file_from_pod
+    wait_for_files_in_pod,
+    wait_for_file_content_in_pod,
+    read_files_from_pod,
+    restart_pod
 )
 
 
-@pytest.mark.watch
-def test_watch_mode_basic(
-    watcher_deployment: dict,
-    k8s_client: client.CoreV1Api,
-    test_namespace: str
-):
-    """Test WATCH mode (informer-based) functionality."""
-    
-    # Default watcher config uses WATCH mode
-    # This test verifies that resources are picked up via watch
-    
-    cm = create_configmap(
-        k8s_client,
-        name="test-watch-mode",
-        namespace=test_namespace,
-        labels={"app": "test"},
-        data={"watch.txt": "watched via informer"}
-    )
-    
-    file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-watch-mode/watch.txt"
-    
-    # Should be picked up quickly in WATCH mode
-    assert wait_for_file_in_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path,
-        timeout=30
-    )
-    
-    content = read_file_from_pod(
-        k8s_client,
-        watcher_deployment["pod_name"],
-        test_namespace,
-        file_path
-    )
-    assert content == "watched via informer"
-
-
 @pytest.mark.watch
 def test_resource_version_tracking(
     watcher_deployment: dict,
@@ -85,15 +53,13 @@ def test_resource_version_tracking(
         body=cm
     )
     
-    # Wait for update
-    time.sleep(5)
-    
     # Verify content was updated
-    content = read_file_from_pod(
+    content = wait_for_file_content_in_pod(
         k8s_client,
         watcher_deployment["pod_name"],
         test_namespace,
-        file_path
+        file_path,
+        "version 2"
     )
     assert content == "version 2"
     
@@ -102,44 +68,67 @@ def test_resource_version_tracking(
 
 
 @pytest.mark.watch
+@pytest.mark.parametrize(
+    "num_resources",
+    [1, 5, pytest.param(50, marks=pytest.mark.slow)],
+    ids=["small", "med", "large"]
+)
 def test_multiple_resources_concurrent(
+    num_resources: int,
     watcher_deployment: dict,
     k8s_client: client.CoreV1Api,
-    test_namespace: str
+    test_namespace: str,
+    io_pool: ThreadPoolExecutor,
+    record_property: Callable[[str, object], None]
 ):
     """Test watching multiple resources created concurrently."""
     
     # Create multiple ConfigMaps at once
-    num_resources = 5
-    
-    for i in range(num_resources):
-        create_configmap(
-            k8s_client,
-            name=f"test-concurrent-{i}",
-            namespace=test_namespace,
-            labels={"app": "test"},
-            data={f"file{i}.txt": f"content {i}"}
-        )
-    
-    # Verify all files are created
-    for i in range(num_resources):
-        file_path = f"/tmp/k8s-watcher-data/{test_namespace}/test-concurrent-{i}/file{i}.txt"
-        
-        assert wait_for_file_in_pod(
-            k8s_client,
-            watcher_deployment["pod_name"],
-            test_namespace,
-            file_path,
-            timeout=30
-        ), f"File for resource {i} was not created"
-        
-        content = read_file_from_pod(
-            k8s_client,
-            watcher_deployment["pod_name"],
-            test_namespace,
-            file_path
-        )
-        assert content == f"content {i}"
+    started = time.monotonic()
+    create_configmaps_bulk(
+        k8s_client,
+        test_namespace,
+        [
+            client.V1ConfigMap(
+                metadata=client.V1ObjectMeta(
+                    name=f"test-concurrent-{i}",
+                    labels={"app": "test"}
+                ),
+                data={f"file{i}.txt": f"content {i}"}
+            )
+            for i in range(num_resources)
+        ],
+        io_pool
+    )
+    
+    # Wait for every file to have content over one exec, so the recorded
+    # time is the watcher's and not spent queueing for client threads
+    prefix = f"/tmp/k8s-watcher-data/{test_namespace}"
+    file_paths = [f"{prefix}/test-concurrent-{i}/file{i}.txt" for i in range(num_resources)]
+    all_written = wait_for_files_in_pod(
+        k8s_client,
+        watcher_deployment["pod_name"],
+        test_namespace,
+        file_paths,
+        timeout=30
+    )
+    synced_at = time.monotonic()
+    
+    # Read every file back in one tar exec
+    contents = read_files_from_pod(
+        k8s_client,
+        watcher_deployment["pod_name"],
+        test_namespace,
+        file_paths
+    )
+    missing = [path for path in file_paths if not contents[path]]
+    assert all_written, f"Files were not written: {missing}"
+    
+    # Reported in the JUnit XML, so scaling regressions show up across runs
+    record_property("sync_seconds", round(synced_at - started, 3))
+    
+    for i, file_path in enumerate(file_paths):
+        assert contents[file_path] == f"content {i}"
 
 
 @pytest.mark.watch
@@ -169,29 +158,15 @@ def test_watch_reconnection(
         timeout=30
     )
     
-    # Restart watcher pod
-    k8s_client.delete_namespaced_pod(
-        name=watcher_deployment["pod_name"],
-        namespace=test_namespace
-    )
-    
-    # Wait for new pod to be ready
-    time.sleep(10)
-    
-    # Get new pod name
-    from helpers import wait_for_pod_ready
-    pods = k8s_client.list_namespaced_pod(
-        namespace=test_namespace,
-        label_selector="app=k8s-watcher"
-    )
-    
-    if not pods.items:
-        pytest.fail("Watcher pod not found after restart")
-    
-    new_pod_name = pods.items[0].metadata.name
+    # The restart below only proves something if the original pod was live
+    assert_watcher_alive(k8s_client, watcher_deployment)
     
-    if not wait_for_pod_ready(k8s_client, new_pod_name, test_namespace, timeout=60):
-        pytest.fail("Watcher pod did not become ready after restart")
+    # Restart watcher pod; it is a bare Pod, so recreate it from its manifest
+    pod_name = watcher_deployment["pod_name"]
+    ready, reason = restart_pod(k8s_client, watcher_deployment["pod"], test_namespace)
+    if not ready:
+        pytest.fail(f"Watcher pod did not become ready after restart: {reason}")
+    watcher_deployment["ready_at"] = time.monotonic()
     
     # Create new ConfigMap after restart
     cm2 = create_configmap(
@@ -206,7 +181,7 @@ def test_watch_reconnection(
     file_path2 = f"/tmp/k8s-watcher-data/{test_namespace}/test-after-restart/after.txt"
     assert wait_for_file_in_pod(
         k8s_client,
-        new_pod_name,
+        pod_name,
         test_namespace,
         file_path2,
         timeout=30